@@ -0,0 +1,11 @@
+import os
+
+
+def pytest_addoption(parser):
+    parser.addoption('--plot', action='store_true', default=False, help='run plotting blocks in tests (requires a display)')
+
+
+def pytest_configure(config):
+    if config.getoption('--plot'):
+        # tests check the environment variable, so they stay runnable as plain scripts
+        os.environ['DESILIKE_PLOT_TESTS'] = '1'
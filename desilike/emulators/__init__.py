@@ -1,5 +1,6 @@
 import os
 import re
+import functools
 import itertools
 
 import numpy as np
@@ -8,6 +9,8 @@ from cosmoprimo.emulators import tools
 
 from desilike import utils, plotting, mpi
 from desilike.base import CollectionCalculator, BaseCalculator, vmap
+from desilike.jax import numpy as jnp
+from desilike.jax import jit
 from desilike.utils import serialize_class, import_class
 from desilike.io import BaseConfig
 from desilike.parameter import ParameterConfig, ParameterCollection, Deriv
@@ -427,11 +430,36 @@ class PointEmulatorEngine(tools.PointEmulatorEngine):
         return sampler.samples
 
 
+@functools.lru_cache(maxsize=32)
+def _taylor_power_schedule(ndim, max_order, max_param_order):
+    # The multiset enumeration and Taylor prefactors only depend on the dimensionality and the
+    # derivative orders: cache them across fits (one per emulated attribute, times the repeated
+    # emulator builds of template sweeps)
+    max_param_order = np.array(max_param_order, dtype='i4')
+    factorial = np.cumprod(np.insert(np.arange(1, max_order + 1), 0, 1)).astype('f8')  # factorial[k] = k!
+    schedule = []
+    for order in range(0, max_order + 1):
+        # Enumerate multisets directly: each multi-index appears exactly once, with Taylor
+        # coefficient 1 / prod_d orders_d! (= multinomial / order!), so no dedup pass is needed.
+        # Bincounts and the max-order cut are computed for all multisets of this order at once
+        indices = list(itertools.combinations_with_replacement(range(ndim), order))
+        indices = np.array(indices, dtype='i4').reshape(len(indices), order)
+        all_orders = np.zeros((len(indices), ndim), dtype='i4')
+        np.add.at(all_orders, (np.arange(len(indices))[:, None], indices), 1)
+        if order:
+            keep = order <= np.where(all_orders > 0, max_param_order, np.iinfo('i4').max).min(axis=1)
+            all_orders = all_orders[keep]
+        prefactors = 1. / factorial[all_orders].prod(axis=1)
+        schedule.append((all_orders, prefactors))
+    return schedule
+
+
 class TaylorEmulatorEngine(tools.TaylorEmulatorEngine):
 
-    def __init__(self, *args, order=3, accuracy=2, method=None, delta_scale=1., **kwargs):
+    def __init__(self, *args, order=3, accuracy=2, method=None, delta_scale=1., dtype='f8', **kwargs):
         super().__init__(*args, **kwargs)
         self.sampler_options = dict(order=order, accuracy=accuracy, method=method, delta_scale=delta_scale)
+        self.dtype = np.dtype(dtype)  # storage / prediction dtype for derivatives; 'f4' halves bandwidth in predict
         assert not self.xoperations, 'xoperations not supported for {} engine'.format(self.name)
         assert not self.yoperations, 'yoperations not supported for {} engine'.format(self.name)
 
@@ -471,7 +499,7 @@ class TaylorEmulatorEngine(tools.TaylorEmulatorEngine):
     def _fit_no_operation(self, X, Y, attrs):
         if self.mpicomm.bcast(Y.derivs is None if self.mpicomm.rank == 0 else None, root=0):
             raise ValueError('Please provide samples with derivatives computed')
-        self.center, self.derivatives, self.powers = None, None, None
+        self.center, self.derivatives, self.powers, self.max_param_order = None, None, None, None
         if self.mpicomm.rank == 0:
             self.center = np.array([np.median(np.unique(xx)) for xx in X.T])
             Y = Y[0]  # only need one element
@@ -482,29 +510,104 @@ class TaylorEmulatorEngine(tools.TaylorEmulatorEngine):
                 for iparam, param in enumerate(self.params):
                     max_param_order[iparam] = max(max_param_order[iparam], deriv[param])
                     max_order = max(max_order, deriv.total())
-            prefactor, degrees = 1., []
-            for order in range(0, max_order + 1):
-                if order: prefactor /= order
-                for indices in itertools.product(range(ndim), repeat=order):
-                    orders = np.bincount(indices, minlength=ndim).astype('i4')
-                    if order and sum(orders) > min(order for o, order in zip(orders, max_param_order) if o):
-                        continue
+            # the Python loop below only runs over the surviving multi-indices of the cached schedule
+            for all_orders, prefactors in _taylor_power_schedule(ndim, max_order, tuple(max_param_order)):
+                for orders, prefactor in zip(all_orders, prefactors):
                     degree = Deriv(dict(zip(self.params, orders)))
                     if degree not in Y.derivs:
                         import warnings
                         warnings.warn("Derivative {} is missing, let's assume it is 0".format(degree))
                         continue
-                    value = prefactor * Y[degree]
-                    if degree in degrees:
-                        self.derivatives[degrees.index(degree)] += value
-                    else:
-                        degrees.append(degree)
-                        self.powers.append(orders)
-                        self.derivatives.append(value)
-            self.derivatives, self.powers = np.array(self.derivatives), np.array(self.powers)
-        self.derivatives = mpi.bcast(self.derivatives if self.mpicomm.rank == 0 else None, mpicomm=self.mpicomm, mpiroot=0)
-        self.powers = self.mpicomm.bcast(self.powers, root=0)
-        self.center = self.mpicomm.bcast(self.center, root=0)
+                    self.powers.append(orders)
+                    self.derivatives.append(prefactor * Y[degree])
+            # Exponents are small ints (<= order), int8 quarters the memory touched by predict
+            self.derivatives, self.powers = np.array(self.derivatives, dtype=self.dtype), np.array(self.powers, dtype='i1')
+            self.max_param_order = self.powers.max(axis=0)
+        # Ship derivatives, powers, center and max_param_order in a single buffered collective:
+        # a small shape/dtype header, then one pickle-free broadcast of a packed byte buffer
+        names = ['derivatives', 'powers', 'center', 'max_param_order']
+        header, buffers = None, []
+        if self.mpicomm.rank == 0:
+            header = []
+            for name in names:
+                array = np.ascontiguousarray(getattr(self, name))
+                header.append((array.shape, array.dtype.str))
+                flat = array.view('u1').ravel()
+                pad = (-flat.size) % 8  # keep each segment 8-byte aligned for the views below
+                if pad: flat = np.concatenate([flat, np.zeros(pad, dtype='u1')])
+                buffers.append(flat)
+        header = self.mpicomm.bcast(header, root=0)
+        buffer = mpi.bcast(np.concatenate(buffers) if self.mpicomm.rank == 0 else None, mpicomm=self.mpicomm, mpiroot=0)
+        offset = 0
+        for name, (shape, dtype) in zip(names, header):
+            dtype = np.dtype(dtype)
+            nbytes = int(np.prod(shape, dtype='intp')) * dtype.itemsize
+            setattr(self, name, buffer[offset:offset + nbytes].view(dtype).reshape(shape))
+            offset += nbytes + (-nbytes) % 8
+        self._set_predict_cache()
+
+    def _set_predict_cache(self):
+        # powers is sparse (most exponents are 0): group terms in buckets of equal nonzero count, so
+        # each bucket evaluates as a dense, homogeneous (n_terms_bucket, count) gather + product that
+        # vectorizes cleanly; the derivative rows are permuted once to bucket order to match
+        powers = np.asarray(self.powers)
+        nterms = powers.shape[0]
+        nonzeros = (powers > 0).sum(axis=1)
+        buckets, term_order = [], []
+        for count in np.unique(nonzeros):
+            terms = np.flatnonzero(nonzeros == count)
+            term_order.append(terms)
+            # active dims first (stable, so in original dim order), truncated to the bucket count
+            dims = np.argsort(powers[terms] == 0, axis=1, kind='stable')[:, :count]
+            buckets.append((dims, np.take_along_axis(powers[terms], dims, axis=1)))
+        term_order = np.concatenate(term_order)
+        # 2D contiguous derivative matrix in bucket order, such that predict contracts with a single GEMM
+        self._flatderivatives = np.ascontiguousarray(self.derivatives.reshape(nterms, -1)[term_order])
+        center, flatderivatives = self.center, self._flatderivatives
+        max_order, yshape = self.max_order, tuple(self.yshape)
+
+        dtype = flatderivatives.dtype
+
+        def _predict(X):
+            diffs = X - center
+            if diffs.dtype != dtype:  # single downcast, such that the whole kernel runs at the storage precision
+                diffs = diffs.astype(dtype)
+            batch_shape = diffs.shape[:-1]
+            # Table of integer powers, tab[o, ..., d] = diffs[..., d]**o, built with repeated multiplies
+            # (jnp.power on a float base lowers to exp(y * log(x))); monomials are then a gather away
+            tab = [jnp.ones_like(diffs), diffs]
+            for order in range(2, max_order + 1):
+                tab.append(tab[-1] * diffs)
+            tab = jnp.stack(tab[:max_order + 1])
+            # (n_terms_bucket, count, *batch) gather per bucket, reduced over the homogeneous count axis
+            monomials = jnp.concatenate([jnp.prod(tab[exps, ..., dims], axis=1) for dims, exps in buckets], axis=0)
+            # Single GEMM streaming the derivative tensor once for the whole batch; the explicit
+            # matmul always dispatches to BLAS, with no per-call einsum path search
+            prediction = jnp.matmul(monomials.reshape(nterms, -1).T, flatderivatives)
+            return prediction.reshape(batch_shape + yshape)
+
+        # Constants (center, powers, derivatives) are closed over, such that XLA fuses the
+        # power table / monomial / contraction chain into a single kernel, traced once per batch shape
+        self._predict = jit(_predict)
+
+    @property
+    def max_order(self):
+        return int(self.max_param_order.max())
+
+    def predict(self, X):
+        return self._predict(jnp.asarray(X))
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        state['max_param_order'] = self.max_param_order
+        return state
+
+    def __setstate__(self, state):
+        super().__setstate__(state)
+        # Backward-compatibility with emulators saved before max_param_order was stored
+        if getattr(self, 'max_param_order', None) is None:
+            self.max_param_order = np.asarray(self.powers).max(axis=0)
+        self._set_predict_cache()
 
 
 class MLPEmulatorEngine(tools.MLPEmulatorEngine):
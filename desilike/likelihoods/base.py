@@ -13,7 +13,8 @@ from desilike import plotting, utils
 def chi2(flatdiff, precision):
     if precision.ndim == 1:
         return (flatdiff * precision).dot(flatdiff.T)
-    return flatdiff.dot(precision).dot(flatdiff.T)
+    # contract precision with flatdiff first: the non-transposed matrix-vector product streams the row-major precision contiguously
+    return flatdiff.dot(precision.dot(flatdiff.T))
 
 
 
@@ -61,15 +61,15 @@ class TracerPowerSpectrumMultipolesObservable(BaseCalculator):
         self.flatdata, self.mocks, self.covariance = None, None, None
         if not isinstance(data, dict):
             self.flatdata = self.load_data(data=data, klim=klim)[0]
+        mock_covariance = None
         if self.mpicomm.bcast(_is_array(covariance) or isinstance(covariance, ObservableCovariance), root=0):
             self.covariance = self.mpicomm.bcast(covariance, root=0)
         else:
-            self.mocks = self.load_data(data=covariance, klim=klim)[-1]
+            _, self.mocks, mock_covariance = self.load_data(data=covariance, klim=klim, with_covariance=True)
         if self.mpicomm.bcast(self.mocks is not None, root=0):
-            covariance = None
-            if self.mpicomm.rank == 0:
-                covariance = np.cov(self.mocks, rowvar=False, ddof=1)
-            self.covariance = self.mpicomm.bcast(covariance, root=0)
+            if self.mpicomm.rank == 0 and mock_covariance is None:  # mocks provided as plain arrays, not streamed through load_all
+                mock_covariance = np.cov(self.mocks, rowvar=False, ddof=1)
+            self.covariance = self.mpicomm.bcast(mock_covariance, root=0)
         self.wmatrix = wmatrix
         if not isinstance(wmatrix, WindowedPowerSpectrumMultipoles):
             self.wmatrix = WindowedPowerSpectrumMultipoles()
@@ -109,8 +109,11 @@ class TracerPowerSpectrumMultipolesObservable(BaseCalculator):
         allowed_transform = [None, 'cubic']
         if self.transform not in allowed_transform:
             raise ValueError('transform must be one of {}'.format(allowed_transform))
+        # Per-ell slices into flat arrays, built once; data / std properties return zero-copy views
+        cumsize = np.insert(np.cumsum([len(kk) for kk in self.k]), 0, 0)
+        self._slices = [slice(start, stop) for start, stop in zip(cumsize[:-1], cumsize[1:])]
 
-    def load_data(self, data=None, klim=None):
+    def load_data(self, data=None, klim=None, with_covariance=False):
 
         def load_data(fn):
             from pypower import MeshFFTPower, PowerSpectrumMultipoles
@@ -147,12 +150,19 @@ class TracerPowerSpectrumMultipolesObservable(BaseCalculator):
                 shotnoise = power.shotnoise
                 if klim is None:
                     klim = {ell: (0, np.inf) for ell in power.ells}
+                # One copy / select and one get_power per distinct k-limit: multipoles sharing
+                # a cut reuse the same slice and rows of the same real-valued power array
+                cache = {}
                 for ell, lim in klim.items():
-                    power_slice = power.copy().select(lim)
+                    key = tuple(lim)
+                    if key not in cache:
+                        power_slice = power.copy().select(lim)
+                        cache[key] = (power_slice, np.atleast_2d(power_slice(complex=False)))
+                    power_slice, data = cache[key]
                     ells.append(ell)
                     list_k.append(power_slice.modeavg())
                     list_kedges.append(power_slice.edges[0])
-                    list_data.append(power_slice(ell=ell, complex=False))
+                    list_data.append(data[list(power_slice.ells).index(ell)])
             return list_k, list_kedges, tuple(ells), list_data, shotnoise
 
         def load_all(lmocks):
@@ -177,6 +187,7 @@ class TracerPowerSpectrumMultipolesObservable(BaseCalculator):
                 self.log_info(msg)
 
             list_y, list_shotnoise = [], []
+            nmocks, mean, m2 = 0, None, None
             for mock in list_mocks:
                 if utils.is_path(mock):
                     mock = load_data(mock)
@@ -187,27 +198,44 @@ class TracerPowerSpectrumMultipolesObservable(BaseCalculator):
                     raise ValueError('{} does not have expected k-edges (based on previous data)'.format(mock))
                 if mock_ells != self.ells:
                     raise ValueError('{} does not have expected poles (based on previous data)'.format(mock))
-                list_y.append(np.concatenate(mock_y))
+                flaty = np.concatenate(mock_y)
+                list_y.append(flaty)
+                # Welford update; the O(nbins^2) covariance accumulation only runs when requested
+                nmocks += 1
+                if mean is None:
+                    mean = np.array(flaty, dtype='f8')
+                    if with_covariance:
+                        m2 = np.zeros((flaty.size, flaty.size), dtype='f8')
+                else:
+                    delta = flaty - mean
+                    mean += delta / nmocks
+                    if with_covariance:
+                        m2 += np.outer(delta, flaty - mean)
                 if mock_shotnoise is not None:
                     list_shotnoise.append(mock_shotnoise)
-            return list_y, list_shotnoise
+            covariance = m2 / (nmocks - 1) if with_covariance and nmocks > 1 else None
+            return list_y, list_shotnoise, covariance
 
-        flatdata, shotnoise, list_shotnoise, list_y = None, None, None, None
+        flatdata, shotnoise, list_shotnoise, list_y, covariance = None, None, None, None, None
         if self.mpicomm.rank == 0 and data is not None:
             if not utils.is_sequence(data):
                 data = [data]
             if any(_is_from_pypower(dd) or isinstance(dd, ObservableArray) for dd in data):
-                list_y, list_shotnoise = load_all(data)
+                list_y, list_shotnoise, covariance = load_all(data)
                 if not list_y: raise ValueError('no data/mocks could be obtained from {}'.format(data))
             else:
                 list_y = list(data)
-            flatdata = np.mean(list_y, axis=0)
+            # Accumulate in place rather than np.mean, which would stack all mocks in a (n_mocks, n_bins) array
+            flatdata = np.array(list_y[0], dtype='f8')
+            for y in list_y[1:]:
+                flatdata += y
+            flatdata /= len(list_y)
             if list_shotnoise:
-                shotnoise = np.mean(list_shotnoise, axis=0)
+                shotnoise = sum(list_shotnoise) / len(list_shotnoise)
 
         self.k, self.kedges, self.ells, flatdata, shotnoise = self.mpicomm.bcast((self.k, self.kedges, self.ells, flatdata, shotnoise) if self.mpicomm.rank == 0 else None, root=0)
         if self.shotnoise is None: self.shotnoise = shotnoise
-        return flatdata, list_y
+        return flatdata, list_y, covariance
 
     @plotting.plotter(interactive={'kw_theory': {'color': 'black', 'label': 'reference'}})
     def plot(self, scaling='kpk', kw_theory=None, fig=None):
@@ -365,8 +393,7 @@ class TracerPowerSpectrumMultipolesObservable(BaseCalculator):
         fig : matplotlib.figure.Figure
         """
         from desilike.observables.plotting import plot_covariance_matrix
-        cumsize = np.insert(np.cumsum([len(k) for k in self.k]), 0, 0)
-        mat = [[self.covariance[start1:stop1, start2:stop2] for start2, stop2 in zip(cumsize[:-1], cumsize[1:])] for start1, stop1 in zip(cumsize[:-1], cumsize[1:])]
+        mat = [[self.covariance[sl1, sl2] for sl2 in self._slices] for sl1 in self._slices]
         return plot_covariance_matrix(mat, x1=self.k, xlabel1=r'$k$ [$h/\mathrm{Mpc}$]', label1=[r'$\ell = {:d}$'.format(ell) for ell in self.ells], corrcoef=corrcoef, **kwargs)
 
     def calculate(self):
@@ -411,14 +438,22 @@ class TracerPowerSpectrumMultipolesObservable(BaseCalculator):
 
     @property
     def data(self):
-        cumsize = np.insert(np.cumsum([len(k) for k in self.k]), 0, 0)
-        return [self.flatdata[start:stop] for start, stop in zip(cumsize[:-1], cumsize[1:])]
+        return [self.flatdata[sl] for sl in self._slices]
+
+    @property
+    def covariance(self):
+        return self._covariance
+
+    @covariance.setter
+    def covariance(self, covariance):
+        self._covariance = covariance
+        self._std = None  # invalidate derived quantities, recomputed lazily
 
     @property
     def std(self):
-        cumsize = np.insert(np.cumsum([len(k) for k in self.k]), 0, 0)
-        diag = np.diag(self.covariance)**0.5
-        return [diag[start:stop] for start, stop in zip(cumsize[:-1], cumsize[1:])]
+        if self._std is None:
+            self._std = np.diag(self.covariance)**0.5
+        return [self._std[sl] for sl in self._slices]
 
     def __getstate__(self):
         state = {}
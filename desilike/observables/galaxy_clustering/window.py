@@ -238,9 +238,11 @@ class WindowedPowerSpectrumMultipoles(BaseCalculator):
                     lim = klim[ell]
                     if lim is not None:  # cut
                         (lo, hi, *step) = klim[ell]
-                        kmask = (kk >= lo) & (kk <= hi)
-                        kk = kk[kmask]  # scale cuts
-                        self.kmasklim[ell][...] = kmask
+                        # k is sorted: searchsorted avoids materializing boolean comparison arrays
+                        start, stop = np.searchsorted(kk, lo, side='left'), np.searchsorted(kk, hi, side='right')
+                        kk = kk[start:stop]  # scale cuts
+                        self.kmasklim[ell][...] = False
+                        self.kmasklim[ell][start:stop] = True
                     if kk.size:
                         k.append(kk)
                         ells.append(ell)
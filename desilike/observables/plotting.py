@@ -76,8 +76,28 @@ def plot_covariance_matrix(covariance, x1=None, x2=None, xlabel1=None, xlabel2=N
     label1, label2 = [_make_list(x, len(size)) for x, size in zip([label1, label2], [size1, size2])]
 
     if corrcoef:
-        mat = utils.cov_to_corrcoef(np.bmat(mat).A)
+        base = mat[0][0].base if isinstance(mat[0][0], np.ndarray) else None
         cumsize1, cumsize2 = [np.insert(np.cumsum(size), 0, 0) for size in [size1, size2]]
+
+        def _is_block_view(item, start1, stop1, start2, stop2):
+            # the block must be exactly the base[start1:stop1, start2:stop2] view — same start
+            # address, shape and strides — not merely any view of base (which could be permuted,
+            # overlapping or strided)
+            if not isinstance(item, np.ndarray) or item.base is not base:
+                return False
+            expected = base[start1:stop1, start2:stop2]
+            return (item.shape == expected.shape and item.strides == expected.strides
+                    and item.__array_interface__['data'][0] == expected.__array_interface__['data'][0])
+
+        if base is not None and base.shape == (sum(size1), sum(size2)) and all(
+                _is_block_view(item, start1, stop1, start2, stop2)
+                for row, (start1, stop1) in zip(mat, zip(cumsize1[:-1], cumsize1[1:]))
+                for item, (start2, stop2) in zip(row, zip(cumsize2[:-1], cumsize2[1:]))):
+            # blocks tile one contiguous matrix in natural order: use it directly instead of
+            # re-assembling a copy with np.bmat
+            mat = utils.cov_to_corrcoef(base)
+        else:
+            mat = utils.cov_to_corrcoef(np.bmat(mat).A)
         mat = [[mat[start1:stop1, start2:stop2] for start2, stop2 in zip(cumsize2[:-1], cumsize2[1:])] for start1, stop1 in zip(cumsize1[:-1], cumsize1[1:])]
 
     vmin, vmax = min(item.min() for row in mat for item in row), max(item.max() for row in mat for item in row)
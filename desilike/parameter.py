@@ -1877,10 +1877,15 @@ class ParameterCollection(BaseParameterCollection):
         """
         toret = {}
         for param in self:
-            try:
-                toret[param.name] = param.eval(**params)
-            except (ParameterError, KeyError):
-                pass
+            # only parameters derived through an expression need :meth:`Parameter.eval`;
+            # for the others, skip the per-parameter re-expansion of ``params`` as keyword arguments
+            if isinstance(param._derived, str) and param._derived not in param._allowed_solved:
+                try:
+                    toret[param.name] = param.eval(**params)
+                except (ParameterError, KeyError):
+                    pass
+            elif param.name in params:
+                toret[param.name] = params[param.name]
         return toret
 
     def prior(self, **params):
@@ -2158,6 +2163,15 @@ class Samples(BaseParameterCollection):
         else:
             super(Samples, self).__init__(data=data, attrs=attrs)
 
+    @classmethod
+    def _from_raw(cls, data, params, attrs=None):
+        # Internal fast path: wrap arrays over already-validated, unique ``params``,
+        # skipping the per-item name lookups and reshaping of __init__
+        new = cls()
+        new.attrs = dict(attrs or {})
+        new.data = [value if isinstance(value, ParameterArray) else ParameterArray(value, param if isinstance(param, Parameter) else Parameter(param)) for param, value in zip(params, data)]
+        return new
+
     def save(self, filename):
         """Save samples to disk."""
         filename = str(filename)
@@ -128,6 +128,11 @@ def plotter(*args, **kwargs):
         @wraps(func)
         def wrapper(*args, fn=None, kw_save=None, show=False, fig=None, **kwargs):
 
+            if fig is None and fn is None and not show and not (use_interactive and kwargs.get('interactive', None)):
+                # fast path: no figure plumbing, saving, showing or widgets requested
+                if use_interactive: kwargs.pop('interactive', None)
+                return func(*args, **kwargs)
+
             from matplotlib import pyplot as plt
 
             if fig is not None:
@@ -96,6 +96,20 @@ def _profiles_transform_forward(self, profiles):
     return toret
 
 
+_pool_state = None
+
+
+def _pool_maximize_one(ii):
+    # Worker for BaseProfiler._maximize_pool; _pool_state is inherited through fork
+    profiler, states, kwargs = _pool_state
+    return profiler._maximize_one(states[ii], **kwargs)
+
+
+def _call_maximize_one(profiler, state, kwargs=None):
+    # Worker for user-provided, map-like pools; requires the profiler to be picklable
+    return profiler._maximize_one(state, **(kwargs or {}))
+
+
 class ProfilerState(object):
 
     def __init__(self, chi2, varied_params, start, gradient=None, **kwargs):
@@ -384,7 +398,25 @@ class BaseProfiler(BaseClass, metaclass=RegisteredProfiler):
     def mpicomm(self, mpicomm):
         self._mpicomm = mpicomm
 
-    def maximize(self, niterations=None, start=None, **kwargs):
+    def _maximize_pool(self, workers, states, **kwargs):
+        """Run independent maximizations through a process pool, for users running on a single MPI process."""
+        if not isinstance(workers, int):  # map-like pool, following the scipy workers API
+            return list(workers.map(functools.partial(_call_maximize_one, self, kwargs=kwargs), states))
+        import multiprocessing
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            if self.mpicomm.rank == 0:
+                self.log_warning('multiprocessing "fork" start method not available; running maximizations serially')
+            return [self._maximize_one(state, **kwargs) for state in states]
+        global _pool_state
+        nworkers = min(workers if workers > 0 else multiprocessing.cpu_count(), len(states))
+        _pool_state = (self, states, kwargs)
+        try:
+            with multiprocessing.get_context('fork').Pool(nworkers) as pool:
+                return pool.map(_pool_maximize_one, range(len(states)))
+        finally:
+            _pool_state = None
+
+    def maximize(self, niterations=None, start=None, workers=None, **kwargs):
         """
         Maximize :attr:`likelihood`.
         The following attributes are added to :attr:`profiles`:
@@ -403,6 +435,11 @@ class BaseProfiler(BaseClass, metaclass=RegisteredProfiler):
             Number of iterations, i.e. of runs of the profiler from independent starting points.
             If ``None``, defaults to :attr:`mpicomm.size` (if > 0, else 1).
 
+        workers : int, pool, default=None
+            Optionally, when running on a single MPI process, distribute the iterations over this
+            number of processes (all cores if < 1), or over a map-like pool (e.g. :class:`multiprocessing.Pool`),
+            following the scipy ``workers`` API. Ignored when several MPI processes are available.
+
         **kwargs : dict
             Optional profiler-specific arguments.
         """
@@ -419,6 +456,11 @@ class BaseProfiler(BaseClass, metaclass=RegisteredProfiler):
         from desilike import vmap
         vlikelihood = vmap(self.likelihood, backend=None, errors='return', return_derived=True)
 
+        states = [ProfilerState(chi2=chi2, start=start[ii], varied_params=self.transformed_params, gradient=gradient, fast=False) for ii in range(niterations)]
+        pooled = None
+        if workers is not None and self.mpicomm.size == 1:
+            pooled = self._maximize_pool(workers, states, **kwargs)
+
         with TaskManager(nprocs_per_task=(self.mpicomm.size + niterations - 1) // niterations, use_all_nprocs=True, mpicomm=self.mpicomm) as tm:
             self.mpicomm = tm.mpicomm
             list_profiles = []
@@ -428,8 +470,7 @@ class BaseProfiler(BaseClass, metaclass=RegisteredProfiler):
                                     bestfit=ParameterBestFit(start[ii][..., None], params=self.varied_params,
                                                              loglikelihood=self.likelihood._param_loglikelihood, logprior=self.likelihood._param_logprior))
                 profiles.bestfit.logposterior[...] = logposterior
-                state = ProfilerState(chi2=chi2, start=start[ii], varied_params=self.transformed_params, gradient=gradient, fast=False)
-                profiles.update(self._maximize_one(state, **kwargs))
+                profiles.update(pooled[ii] if pooled is not None else self._maximize_one(states[ii], **kwargs))
                 profiles = _profiles_transform_forward(self, profiles)
                 for param in self.likelihood.all_params.select(fixed=True, derived=False):
                     profiles.bestfit[param] = np.array([param.value], dtype='f8')
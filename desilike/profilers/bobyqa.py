@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 from desilike import utils
@@ -65,7 +67,7 @@ class BOBYQAProfiler(BaseProfiler):
     def _maximize_one(self, state, max_iterations=int(1e5), **kwargs):
         import pybobyqa
         infs = [- 1e20, 1e20]  # pybobyqa defaults
-        bounds = np.array([[inf if np.isinf(lim) else lim for lim, inf in zip(param.prior.limits, infs)] for param in state.varied_params]).T
+        bounds = np.array([[inf if math.isinf(lim) else lim for lim, inf in zip(param.prior.limits, infs)] for param in state.varied_params]).T
         with LoggingContext('warning') as log:
             result = pybobyqa.solve(objfun=state.chi2, x0=state.start, bounds=bounds, maxfun=max_iterations, **kwargs)
         success = result.flag == result.EXIT_SUCCESS
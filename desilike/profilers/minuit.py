@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 from desilike.samples.profiles import Profiles, ParameterArray, Samples, ParameterContours, ParameterBestFit, ParameterCovariance
@@ -74,12 +76,21 @@ class MinuitProfiler(BaseProfiler):
 
         start, chi2, varied_params = state.start, state.chi2, state.varied_params
 
-        def chi2m(*values):
-            return chi2(values)
+        # specialize the objective to the exact parameter count: named arguments spare
+        # the star-args tuple packing on each of Minuit's many calls
+        args = ', '.join('p{:d}'.format(i) for i in range(len(varied_params)))
+        namespace = {'chi2': chi2}
+        exec('def chi2m({args}): return chi2(({args},))'.format(args=args), namespace)
+        chi2m = namespace['chi2m']
 
         import iminuit
         minuit_params = {}
-        minuit_params['name'] = parameter_names = [str(param) for param in varied_params]
+        # _get_minuit is rebuilt for every restart, interval and contour; cache the name strings
+        # for the (stable) varied_params collection
+        cache = getattr(self, '_parameter_names', None)
+        if cache is None or cache[0] is not varied_params:
+            cache = self._parameter_names = (varied_params, [str(param) for param in varied_params])
+        minuit_params['name'] = parameter_names = cache[1]
 
         if state.gradient is not None:
 
@@ -92,11 +103,10 @@ class MinuitProfiler(BaseProfiler):
         minuit.errordef = 1.0
         if state.fast is not None:
             minuit.strategy = 0 if state.fast else 1
-        for param, value in zip(varied_params, start.T):
-            minuit.values[str(param)] = value.flat[0]
-            minuit.limits[str(param)] = tuple(None if np.isinf(lim) else lim for lim in param.prior.limits)
-            if param.ref.is_proper():
-                minuit.errors[str(param)] = param.proposal
+        # bulk assignment through iminuit's array-like views, instead of one item assignment per parameter
+        minuit.values = [value.flat[0] for value in start.T]
+        minuit.limits = [tuple(None if math.isinf(lim) else lim for lim in param.prior.limits) for param in varied_params]
+        minuit.errors = [param.proposal if param.ref.is_proper() else error for param, error in zip(varied_params, minuit.errors.to_numpy())]
         return minuit
 
     def maximize(self, *args, **kwargs):
@@ -140,8 +150,9 @@ class MinuitProfiler(BaseProfiler):
                     self.log_warning('hesse failed: {}'.format(exc))
         bestfit_attrs = {name: getattr(minuit.fmin, name) for name in ['nfcn', 'ngrad', 'is_valid', 'is_above_max_edm', 'has_reached_call_limit', 'time']}
         covariance_attrs = {name: getattr(minuit.fmin, name) for name in ['has_accurate_covar', 'has_posdef_covar', 'has_made_posdef_covar']}
-        profiles.set(bestfit=ParameterBestFit([np.atleast_1d(minuit.values[str(param)]) for param in state.varied_params] + [- 0.5 * np.atleast_1d(minuit.fval)], params=state.varied_params + ['logposterior'], attrs=bestfit_attrs))
-        profiles.set(error=Samples([np.atleast_1d(minuit.errors[str(param)]) for param in state.varied_params], params=state.varied_params, attrs=covariance_attrs))
+        # to_numpy() returns values / errors in state.varied_params order with one C-level copy
+        profiles.set(bestfit=ParameterBestFit(list(minuit.values.to_numpy().reshape(-1, 1)) + [- 0.5 * np.atleast_1d(minuit.fval)], params=state.varied_params + ['logposterior'], attrs=bestfit_attrs))
+        profiles.set(error=Samples._from_raw(list(minuit.errors.to_numpy().reshape(-1, 1)), params=state.varied_params, attrs=covariance_attrs))
         if not state.fast:
             if minuit.covariance is not None:
                 covariance = np.array(minuit.covariance)
@@ -188,7 +199,7 @@ class MinuitProfiler(BaseProfiler):
         interval = np.array([merrors.lower, merrors.upper])
         attrs = {name: getattr(merrors, name) for name in ['is_valid', 'lower_valid', 'upper_valid', 'at_lower_limit', 'at_upper_limit', 'at_lower_max_fcn', 'at_upper_max_fcn',
                                                            'lower_new_min', 'upper_new_min', 'nfcn', 'min']}
-        profiles.set(interval=Samples([interval], params=[param], attrs={name: attrs}))
+        profiles.set(interval=Samples._from_raw([interval], params=[param], attrs={name: attrs}))
         return profiles
 
     def contour(self, *args, **kwargs):
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 
 from desilike.samples.profiles import Profiles, Samples, ParameterBestFit, ParameterCovariance
@@ -101,7 +103,7 @@ class ScipyProfiler(BaseProfiler):
     def _maximize_one(self, state, max_iterations=int(1e5), tol=None, **kwargs):
         profiles = Profiles()
         from scipy import optimize
-        bounds = [tuple(None if np.isinf(lim) else lim for lim in param.prior.limits) for param in state.varied_params]
+        bounds = [tuple(None if math.isinf(lim) else lim for lim in param.prior.limits) for param in state.varied_params]
         kw = {}
         if state.gradient is not None:
             kw['jac'] = state.gradient
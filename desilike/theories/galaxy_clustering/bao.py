@@ -11,11 +11,13 @@ from desilike import plotting
 from desilike.jax import numpy as jnp
 from desilike.jax import jit, interp1d
 from .power_template import BAOPowerSpectrumTemplate
-from .base import (BaseTheoryPowerSpectrumMultipoles, BaseTheoryPowerSpectrumMultipolesFromWedges, BaseTheoryCorrelationFunctionFromPowerSpectrumMultipoles)
+from .base import (BaseTheoryPowerSpectrumMultipoles, BaseTheoryPowerSpectrumMultipolesFromWedges, BaseTheoryCorrelationFunctionFromPowerSpectrumMultipoles, _legendre_matrix)
 
 
 def _interp(template, name, k):
-    return interp1d(jnp.log10(k), jnp.log10(template.k), getattr(template, name), method='cubic')
+    logk = getattr(template, '_logk', None)  # precomputed by templates; emulated ones may not carry it
+    if logk is None: logk = jnp.log10(template.k)
+    return interp1d(jnp.log10(k), logk, getattr(template, name), method='cubic')
     #return getattr(template, name + '_interpolator')(k)
 
 
@@ -39,6 +41,25 @@ def _get_orders(base, params, ells):
     return orders
 
 
+def _stack_basis(ells, orders, matrix):
+    # SoA layout for per-multipole terms: flat coefficient order and a stacked
+    # (nterms, nells, nx) basis tensor, contracted in one tensordot instead of one dot per multipole
+    names, ills, rows = [], [], []
+    for ill, ell in enumerate(ells):
+        for row, name in zip(np.asarray(matrix[ell]), orders[ell]):
+            names.append(name)
+            ills.append(ill)
+            rows.append(row)
+    basis = np.zeros((len(names), len(ells)) + (rows[0].shape if rows else (0,)))
+    for it, (ill, row) in enumerate(zip(ills, rows)):
+        basis[it, ill] = row
+    return names, jnp.asarray(basis)
+
+
+def _set_broadband_basis(obj):
+    obj._bb_names, obj._bb_basis = _stack_basis(obj.ells, obj.broadband_orders, obj.broadband_matrix)
+
+
 def _kernel_func(x, kernel='tsc'):
     toret = np.zeros_like(x)
     if kernel == 'ngp':
@@ -110,6 +131,11 @@ class DampedBAOWigglesPowerSpectrumMultipoles(BaseBAOWigglesPowerSpectrumMultipo
         super(DampedBAOWigglesPowerSpectrumMultipoles, self).initialize(*args, **kwargs)
         self.model = str(model)
         self.set_k_mu(k=self.k, mu=mu, method=method, ells=self.ells)
+        # fixed per instance: fiducial (nk, 1) x mu grids entering fog / damping, and the reciso smoothing kernel
+        self._k2 = self.k[:, None]**2
+        self._mu2 = self.mu**2
+        self._kmu2 = self._k2 * self._mu2
+        self._sk = np.exp(-1. / 2. * self._k2 * self.smoothing_radius**2) if self.mode == 'reciso' else 0.
         if self.template.only_now:
             for param in self.init.params.select(basename=['sigmapar', 'sigmaper']):
                 param.update(fixed=True)
@@ -121,29 +147,29 @@ class DampedBAOWigglesPowerSpectrumMultipoles(BaseBAOWigglesPowerSpectrumMultipo
         pknowap = _interp(self.template, 'pknow_dd', kap)
         pkap = _interp(self.template, 'pk_dd', kap)
         if self.model == 'standard':  # Chen 2023
-            k, mu = self.k[:, None], self.mu
             pkwap = pkap - pknowap
-            sigma_nl2ap = kap**2 * (sigmapar**2 * muap**2 + sigmaper**2 * (1. - muap**2))
-            sk = 0.
-            if self.mode == 'reciso': sk = jnp.exp(-1. / 2. * (k * self.smoothing_radius)**2)  # taken at fiducial coordinates
-            Cap = (b1 + f * muap**2 * (1 - sk))**2 * jnp.exp(-sigma_nl2ap / 2.)
-            fog = 1. / (1. + (sigmas * k * mu)**2 / 2.)**2.
-            B = (b1 + f * mu**2 * (1 - sk))**2 * fog
-            pknow = _interp(self.template, 'pknow_dd', k)
+            muap2 = muap**2
+            # damping factored as sigmaper^2 k^2 + (sigmapar^2 - sigmaper^2) (k mu)^2: one (nk, nmu) temporary instead of three
+            sigma_nl2ap = kap**2 * (sigmaper**2 + (sigmapar**2 - sigmaper**2) * muap2)
+            sk = self._sk  # taken at fiducial coordinates
+            Cap = (b1 + f * muap2 * (1 - sk))**2 * jnp.exp(-sigma_nl2ap / 2.)
+            fog = 1. / (1. + sigmas**2 / 2. * self._kmu2)**2.
+            B = (b1 + f * self._mu2 * (1 - sk))**2 * fog
+            pknow = _interp(self.template, 'pknow_dd', self.k[:, None])
             pkmu = B * pknow + Cap * pkwap
-            self.power = self.to_poles(pkmu)
         else:
-            if 'fix-damping' in self.model: k, mu = self.k[:, None], self.mu
-            else: k, mu = kap, muap
-            sigma_nl2 = k**2 * (sigmapar**2 * mu**2 + sigmaper**2 * (1. - mu**2))
+            if 'fix-damping' in self.model: k2, mu2 = self._k2, self._mu2
+            else: k2, mu2 = kap**2, muap**2
+            sigma_nl2 = k2 * (sigmaper**2 + (sigmapar**2 - sigmaper**2) * mu2)
             damped_wiggles = (pkap - pknowap) / pknowap * jnp.exp(-sigma_nl2 / 2.)
-            if 'move-all' in self.model: k, mu = kap, muap
-            else: k, mu = self.k[:, None], self.mu
+            if 'move-all' in self.model:
+                k, mu2, kmu2, sk = kap, muap**2, kap**2 * muap**2, 0.
+                if self.mode == 'reciso': sk = jnp.exp(-1. / 2. * (k * self.smoothing_radius)**2)
+            else:
+                k, mu2, kmu2, sk = self.k[:, None], self._mu2, self._kmu2, self._sk
             pknow = _interp(self.template, 'pknow_dd', k)
-            fog = 1. / (1. + (sigmas * k * mu)**2 / 2.)**2.
-            sk = 0.
-            if self.mode == 'reciso': sk = jnp.exp(-1. / 2. * (k * self.smoothing_radius)**2)
-            pksmooth = (b1 + f * mu**2 * (1 - sk))**2 * pknow
+            fog = 1. / (1. + sigmas**2 / 2. * kmu2)**2.
+            pksmooth = (b1 + f * mu2 * (1 - sk))**2 * pknow
             if 'fog-damping' in self.model:  # Beutler2016
                 pkmu = pksmooth * fog * (1. + damped_wiggles)
             else:  # Howlett 2023
@@ -323,6 +349,7 @@ class FlexibleBAOWigglesPowerSpectrumMultipoles(BaseBAOWigglesPowerSpectrumMulti
     def initialize(self, *args, mu=10, method='leggauss', model='standard', wiggles='pcs', kp=None, **kwargs):
         super(FlexibleBAOWigglesPowerSpectrumMultipoles, self).initialize(*args, **kwargs)
         self.set_k_mu(k=self.k, mu=mu, method=method, ells=self.ells)
+        self._legendre_mu = _legendre_matrix(self.mu, self.ells)  # fixed mu-grid: evaluate once
         self.model = str(model)
         self.wiggles = str(wiggles)
         if kp is None: self.kp = 2. * np.pi / self.rs_drag_fid
@@ -353,16 +380,14 @@ class FlexibleBAOWigglesPowerSpectrumMultipoles(BaseBAOWigglesPowerSpectrumMulti
         bb_params = ['b1', 'dbeta']
         for params in self.wiggles_orders.values(): bb_params += list(params)
         self.init.params = self.init.params.select(basename=bb_params)
+        self._ml_names, self._ml_basis = _stack_basis(self.ells, self.wiggles_orders, self.wiggles_matrix)
+        self._ml_const = np.array([1. if ell == 0 else 0. for ell in self.ells])[:, None]
 
     @jit(static_argnums=[0])
     def get_wiggles(self, wiggles, **kwargs):
-        damped_wiggles = 0.
-        for ell in self.ells:
-            mult = jnp.array([kwargs[name] for name in self.wiggles_orders[ell]]).dot(self.wiggles_matrix[ell])
-            if ell == 0: mult += 1.
-            leg = special.legendre(ell)(self.mu)
-            damped_wiggles += wiggles * mult[:, None] * leg
-        return damped_wiggles
+        coeffs = jnp.array([kwargs[name] for name in self._ml_names])
+        mult = jnp.tensordot(coeffs, self._ml_basis, axes=(0, 0)) + self._ml_const  # (nells, nk), with 1 added to the monopole
+        return wiggles * jnp.tensordot(mult, self._legendre_mu, axes=(0, 0))
 
     def calculate(self, b1=1., dbeta=1., **kwargs):
         super(FlexibleBAOWigglesPowerSpectrumMultipoles, self).calculate()
@@ -523,10 +548,13 @@ class BaseBAOWigglesTracerPowerSpectrumMultipoles(BaseTheoryPowerSpectrumMultipo
         bb_params = []
         for params in self.broadband_orders.values(): bb_params += list(params)
         self.init.params = self.init.params.select(basename=bb_params)
+        _set_broadband_basis(self)
 
     @jit(static_argnums=[0])
     def get_broadband(self, **params):
-        return jnp.array([jnp.array([params.get(name, 0.) for name in self.broadband_orders[ell]]).dot(self.broadband_matrix[ell]) for ell in self.ells])
+        if not self._bb_names: return 0.
+        coeffs = jnp.array([params.get(name, 0.) for name in self._bb_names])
+        return jnp.tensordot(coeffs, self._bb_basis, axes=(0, 0))
 
     def calculate(self, **params):
         for name in ['z', 'k', 'ells']:
@@ -897,12 +925,15 @@ class BaseBAOWigglesTracerCorrelationFunctionMultipoles(BaseTheoryCorrelationFun
             for param in list(power_params):
                 if param.basename in bb_params: del power_params[param]
             self.power.params = power_params
+            _set_broadband_basis(self)
 
     def calculate(self, **params):
         for name in ['z', 'ells']:
             setattr(self, name, getattr(self.power, name))
         super(BaseBAOWigglesTracerCorrelationFunctionMultipoles, self).calculate()
-        self.corr += jnp.array([jnp.array([params.get(name, 0.) for name in self.broadband_orders[ell]]).dot(self.broadband_matrix[ell]) for ell in self.ells])
+        if self._bb_names:
+            coeffs = jnp.array([params.get(name, 0.) for name in self._bb_names])
+            self.corr += jnp.tensordot(coeffs, self._bb_basis, axes=(0, 0))
 
     @property
     def pt(self):
@@ -2,19 +2,42 @@ import numpy as np
 from scipy import special
 
 from desilike.jax import numpy as jnp
-from desilike.jax import interp1d, jit
+from desilike.jax import interp1d, jit, to_nparray
 from desilike.cosmo import is_external_cosmo
 from desilike.theories.primordial_cosmology import get_cosmo, Cosmoprimo, constants
 from desilike.base import BaseCalculator
 from desilike import plotting, utils
 
 
+# default grids, allocated once and frozen; initialize() copies them into the instance
+_k_default = np.linspace(0.01, 0.2, 101)
+_k_default.setflags(write=False)
+_s_default = np.linspace(20., 200, 101)
+_s_default.setflags(write=False)
+
+
+def _legendre_matrix(mu, ells):
+    """
+    Return Legendre polynomials of orders ``ells`` evaluated at ``mu``, as one contiguous
+    (nells, nmu) array: all orders up to max(ells) are generated with the three-term recurrence,
+    then the requested rows are selected.
+    """
+    mu = np.asarray(mu, dtype='f8')
+    ellmax = max(ells)
+    poly = np.empty((ellmax + 1,) + mu.shape, dtype='f8')
+    poly[0] = 1.
+    if ellmax > 0: poly[1] = mu
+    for ell in range(1, ellmax):
+        poly[ell + 1] = ((2 * ell + 1) * mu * poly[ell] - ell * poly[ell - 1]) / (ell + 1)
+    return poly[list(ells)]
+
+
 class BaseTheoryPowerSpectrumMultipoles(BaseCalculator):
 
     """Base class for theory power spectrum multipoles."""
 
     def initialize(self, k=None, ells=(0, 2, 4)):
-        if k is None: k = np.linspace(0.01, 0.2, 101)
+        if k is None: k = _k_default
         self.k = np.array(k, dtype='f8')
         self.ells = tuple(ells)
 
@@ -31,7 +54,7 @@ class BaseTheoryCorrelationFunctionMultipoles(BaseCalculator):
     """Base class for theory correlation function multipoles."""
 
     def initialize(self, s=None, ells=(0, 2, 4)):
-        if s is None: s = np.linspace(20., 200, 101)
+        if s is None: s = _s_default
         self.s = np.array(s, dtype='f8')
         self.ells = tuple(ells)
 
@@ -49,7 +72,7 @@ class BaseTheoryCorrelationFunctionFromPowerSpectrumMultipoles(BaseTheoryCorrela
     _initialize_with_namespace = True
 
     def initialize(self, s=None, power=None, interp_order=1, **kwargs):
-        if s is None: s = np.linspace(20., 200, 101)
+        if s is None: s = _s_default
         self.s = np.array(s, dtype='f8')
         self.interp_order = {'linear': 1, 'cubic': 3}.get(interp_order, interp_order)
         allowed_interp_order = [1, 3]
@@ -75,6 +98,23 @@ class BaseTheoryCorrelationFunctionFromPowerSpectrumMultipoles(BaseTheoryCorrela
         self.ells = self.power.ells
         from cosmoprimo import PowerToCorrelation
         self.fftlog = PowerToCorrelation(self.k, ell=self.ells, q=0, lowring=True)
+        # The interpolation onto the fftlog grid and the high-k extension in get_corr are both linear
+        # in the input spectra: precompute them as a single (nkin, nk) operator, applied to all
+        # multipoles in one matmul per call
+        nin = len(self.kin)
+        interp = np.asarray(interp1d(np.log10(self.k_mid), np.log10(self.kin), np.eye(nin), method=self.interp_order))
+        tail = np.zeros((len(self.logk_high), nin), dtype='f8')
+        inv_dlogk = 1. / np.log10(self.kin[-1] / self.kin[-2])
+        tail[:, -1] = (1. + self.logk_high * inv_dlogk) * self.damp_high
+        tail[:, -2] = - self.logk_high * inv_dlogk * self.damp_high
+        self._pk_matrix = np.concatenate([interp, tail], axis=0).T
+        # The fftlog output grids are fixed, so the final interpolation onto self.s reduces to
+        # gathers with precomputed indices and linear weights, fused over multipoles
+        sgrid = np.asarray(self.fftlog(np.zeros((len(self.ells), self.k.size)))[0])
+        index = np.array([np.clip(np.searchsorted(ss, self.s, side='right') - 1, 0, ss.size - 2) for ss in sgrid])
+        slow, shigh = np.take_along_axis(sgrid, index, axis=-1), np.take_along_axis(sgrid, index + 1, axis=-1)
+        self._corr_index = index
+        self._corr_frac = np.clip((self.s - slow) / (shigh - slow), 0., 1.)
         self.set_params()
 
     def set_params(self):
@@ -126,14 +166,11 @@ class BaseTheoryCorrelationFunctionFromPowerSpectrumMultipoles(BaseTheoryCorrela
     """
     @jit(static_argnums=[0])
     def get_corr(self, power):  # least terrible solution, others fail when pk2[-2] ~ 0 and pk2[-1] < 0
-        tmp = []
-        for pk in power:
-            slope_high = (pk[-1] - pk[-2]) / np.log10(self.kin[-1] / self.kin[-2])
-            interp = interp1d(np.log10(self.k_mid), np.log10(self.kin), pk, method=self.interp_order)
-            tmp.append(jnp.concatenate([interp, (pk[-1] + slope_high * self.logk_high) * self.damp_high], axis=-1))
-            #tmp.append(jnp.concatenate([interp, (pk[-1] + slope_high * self.logk_high)], axis=-1) * self.damp)
-        s, corr = self.fftlog(jnp.vstack(tmp))
-        return jnp.array([jnp.interp(self.s, ss, cc) for ss, cc in zip(s, corr)])
+        # linear-slope extension of interp1d + damped high-k tail, precomputed as _pk_matrix at initialization
+        s, corr = self.fftlog(jnp.dot(power, self._pk_matrix))
+        clow = jnp.take_along_axis(corr, self._corr_index, axis=-1)
+        chigh = jnp.take_along_axis(corr, self._corr_index + 1, axis=-1)
+        return clow + self._corr_frac * (chigh - clow)
 
     def calculate(self):
         self.corr = self.get_corr(self.power.power)
@@ -201,11 +238,12 @@ class BaseTheoryPowerSpectrumMultipolesFromWedges(BaseTheoryPowerSpectrumMultipo
     def set_k_mu(self, k, mu=20, method='leggauss', ells=(0, 2, 4)):
         self.k = np.asarray(k, dtype='f8')
         self.mu, wmu = utils.weights_mu(mu, method=method)
-        self.wmu = np.array([wmu * (2 * ell + 1) * special.legendre(ell)(self.mu) for ell in ells])
+        self.wmu = (2 * np.array(ells)[:, None] + 1) * _legendre_matrix(self.mu, ells) * wmu
 
     @jit(static_argnums=[0])
     def to_poles(self, pkmu):
-        return jnp.sum(pkmu * self.wmu[:, None, :], axis=-1)
+        # contract over mu as a matrix product, instead of materializing the (nells, nk, nmu) temporary
+        return jnp.moveaxis(jnp.tensordot(pkmu, self.wmu, axes=(-1, -1)), -1, 0)
 
 
 @jit
@@ -321,6 +359,7 @@ class APEffect(BaseCalculator):
                 self.DH_over_rd_fid = self.DH_fid / rs_drag_fid
                 self.DM_over_rd_fid = self.DM_fid / rs_drag_fid
                 self.DV_over_rd_fid = self.DV_fid / rs_drag_fid
+        self._ap_cache = {}
 
     def calculate(self, **params):
         if self.mode in ['geometry', 'bao']:
@@ -352,8 +391,23 @@ class APEffect(BaseCalculator):
         self.qap = self.qpar / self.qper
         self.qiso = self.qpar**self.eta * self.qper**(1. - self.eta)
 
+    def _ap_cached(self, func, x, mu):
+        # Reuse the previous (jac, xap, muap) when qpar, qper did not change since the last call
+        # with the same grids, e.g. when only bias-like parameters vary; disabled under jax tracing
+        qpar, qper = to_nparray(self.qpar), to_nparray(self.qper)
+        if qpar is None or qper is None or qpar.ndim or qper.ndim:
+            return func(x, mu, qpar=self.qpar, qper=self.qper)
+        key, qs = (func, id(x), id(mu)), (qpar.item(), qper.item())
+        cached = self._ap_cache.get(key, None)
+        # pin x, mu in the entry and identity-check them: id() alone could collide with a new
+        # array reusing the address of a collected grid
+        if cached is None or cached[0] is not x or cached[1] is not mu or cached[2] != qs:
+            if len(self._ap_cache) > 8: self._ap_cache.clear()
+            cached = self._ap_cache[key] = (x, mu, qs, func(x, mu, qpar=qpar, qper=qper))
+        return cached[3]
+
     def ap_k_mu(self, k, mu):
-        return ap_k_mu(k, mu, qpar=self.qpar, qper=self.qper)
+        return self._ap_cached(ap_k_mu, k, mu)
 
     def ap_s_mu(self, s, mu):
-        return ap_s_mu(s, mu, qpar=self.qpar, qper=self.qper)
+        return self._ap_cached(ap_s_mu, s, mu)
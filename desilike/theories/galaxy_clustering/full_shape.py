@@ -4,7 +4,7 @@ import numpy as np
 from scipy import interpolate
 
 from desilike.jax import numpy as jnp
-from desilike.jax import jit, interp1d
+from desilike.jax import jit, interp1d, to_nparray
 from desilike import jax
 from desilike import plotting, utils, BaseCalculator
 from .base import BaseTheoryPowerSpectrumMultipolesFromWedges
@@ -405,7 +405,9 @@ class SimpleTracerPowerSpectrumMultipoles(BasePTPowerSpectrumMultipoles, BaseThe
         sigmanl2 = self.k[:, None]**2 * (sigmapar**2 * self.mu**2 + sigmaper**2 * (1. - self.mu**2))
         damping = jnp.exp(-sigmanl2 / 2.)
         #pkmu = jac * damping * (b1X + f * muap**2) * (b1Y + f * muap**2) * jnp.interp(jnp.log10(kap), jnp.log10(self.template.k), self.template.pk_dd) + sn0 / self.nd
-        pkmu = jac * damping * (b1X + f * muap**2) * (b1Y + f * muap**2) * interp1d(jnp.log10(kap), jnp.log10(self.template.k), self.template.pk_dd, method='cubic') + sn0 / self.nd
+        logk = getattr(self.template, '_logk', None)
+        if logk is None: logk = jnp.log10(self.template.k)
+        pkmu = jac * damping * (b1X + f * muap**2) * (b1Y + f * muap**2) * interp1d(jnp.log10(kap), logk, self.template.pk_dd, method='cubic') + sn0 / self.nd
         self.power = self.to_poles(pkmu)
 
     def get(self):
@@ -479,19 +481,28 @@ class KaiserPowerSpectrumMultipoles(BasePTPowerSpectrumMultipoles, BaseTheoryPow
     def initialize(self, *args, mu=8, **kwargs):
         super(KaiserPowerSpectrumMultipoles, self).initialize(*args, mu=mu, method='leggauss', **kwargs)
         #self.template.init.update(k=np.logspace(-4, 2, 1000))
+        # Legendre decompositions of 1, mu^2 and mu^4, for the analytic projection below
+        self._poles_dd = np.array([1. if ell == 0 else 0. for ell in self.ells])
+        self._poles_dt = np.array([{0: 1. / 3., 2: 2. / 3.}.get(ell, 0.) for ell in self.ells])
+        self._poles_tt = np.array([{0: 1. / 5., 2: 4. / 7., 4: 8. / 35.}.get(ell, 0.) for ell in self.ells])
 
     def calculate(self, sigmapar=0., sigmaper=0.):
         super(KaiserPowerSpectrumMultipoles, self).calculate()
-        jac, kap, muap = self.template.ap_k_mu(self.k, self.mu)
         f = self.template.f
-        sigmanl2 = kap**2 * (sigmapar**2 * muap**2 + sigmaper**2 * (1. - muap**2))
-        damping = jnp.exp(-sigmanl2 / 2.)
-
-        self.pktable = []
         self.k11 = self.template.k
         self.pk11 = self.template.pk_dd
-        pktable = jac * damping * interp1d(jnp.log10(kap), jnp.log10(self.k11), self.pk11, method='cubic')
-        self.pktable = {'pk_dd': self.to_poles(pktable), 'pk_dt': self.to_poles(f * muap**2 * pktable), 'pk_tt': self.to_poles(f**2 * muap**4 * pktable)}
+        # Without AP distortion nor damping, the mu-integrals have a closed form; only take that path
+        # when the relevant parameters are concrete scalars (no jax tracers)
+        values = [to_nparray(value) for value in (getattr(self.template, 'qpar', None), getattr(self.template, 'qper', None), sigmapar, sigmaper)]
+        if all(value is not None and value.ndim == 0 for value in values) and values[0] == values[1] == 1. and values[2] == values[3] == 0. and jnp.ndim(self.pk11) == 1:
+            pk = interp1d(np.log10(self.k), jnp.log10(self.k11), self.pk11, method='cubic')
+            self.pktable = {'pk_dd': self._poles_dd[:, None] * pk, 'pk_dt': f * self._poles_dt[:, None] * pk, 'pk_tt': f**2 * self._poles_tt[:, None] * pk}
+        else:
+            jac, kap, muap = self.template.ap_k_mu(self.k, self.mu)
+            sigmanl2 = kap**2 * (sigmapar**2 * muap**2 + sigmaper**2 * (1. - muap**2))
+            damping = jnp.exp(-sigmanl2 / 2.)
+            pktable = jac * damping * interp1d(jnp.log10(kap), jnp.log10(self.k11), self.pk11, method='cubic')
+            self.pktable = {'pk_dd': self.to_poles(pktable), 'pk_dt': self.to_poles(f * muap**2 * pktable), 'pk_tt': self.to_poles(f**2 * muap**4 * pktable)}
         self.pktable['pk11'] = self.pktable['pk_dd']
 
     def __getstate__(self):
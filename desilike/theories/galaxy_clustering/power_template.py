@@ -1,9 +1,12 @@
+import functools
+import math
 import re
 
 import numpy as np
 from cosmoprimo import PowerSpectrumBAOFilter, PowerSpectrumInterpolator1D
 
 from desilike.jax import numpy as jnp
+from desilike.jax import to_nparray
 from desilike.base import BaseCalculator
 from desilike.cosmo import is_external_cosmo
 from desilike.parameter import ParameterCollection
@@ -13,6 +16,18 @@ from .base import APEffect
 
 _kw_interp = dict(extrap_kmin=1e-7, extrap_kmax=1e2)
 
+# default template k-grid, allocated once and frozen; initialize() copies it into the instance
+_k_default = np.logspace(-3., 1., 400)
+_k_default.setflags(write=False)
+
+# c [km/s] / 100, such that DH = _c_over_100 / efunc(z); folded at import to keep it off the per-call path
+_c_over_100 = constants.c / 1e5
+
+# 2-point stencil for the ShapeFit slope: fixed relative offsets around the (cosmology-dependent) pivot
+_dk_stencil = 1e-2
+_k_stencil_unit = np.array([1. - _dk_stencil, 1. + _dk_stencil])
+_inv_dlogk_stencil = 1. / math.log((1. + _dk_stencil) / (1. - _dk_stencil))
+
 
 def _bcast_shape(array, shape, axis=0):
     # Return array with shape, and size matching along axis
@@ -22,6 +37,37 @@ def _bcast_shape(array, shape, axis=0):
     return array.reshape(tshape)
 
 
+# Tracer pairs entering the theory requirements shared by the extractors / templates below; built once at import
+_cosmo_requires_of = {'sigma8_z': [('delta_cb', 'delta_cb'), ('theta_cb', 'theta_cb')],
+                      'pk_interpolator': [('delta_cb', 'delta_cb')]}
+
+
+def _base_cosmo_requires(z, k=None):
+    # cosmo_requires only used for external bindings (cobaya, cosmosis, montepython): specifies the input theory requirements
+    pk_interpolator = {'z': z}
+    if k is not None: pk_interpolator['k'] = k
+    pk_interpolator['of'] = _cosmo_requires_of['pk_interpolator']
+    return {'fourier': {'sigma8_z': {'z': z, 'of': _cosmo_requires_of['sigma8_z']}, 'pk_interpolator': pk_interpolator},
+            'thermodynamics': {'rs_drag': None}}
+
+
+_fiducial_filter_cache = {}
+
+
+def _fiducial_bao_filter(pk_interpolator, engine, cosmo, z):
+    # The wiggle / smooth split of the fiducial spectrum only depends on (fiducial, engine, z);
+    # templates instantiated in sweep loops share the fiducial Cosmology instance (see get_cosmo),
+    # so run the filter once and reuse both the filter and its smooth interpolator.
+    # The fiducial instance is kept in the cache value, guaranteeing the id-based key stays valid
+    key = (id(cosmo), str(engine), getattr(z, 'tobytes', lambda: z)())
+    cached = _fiducial_filter_cache.get(key, None)
+    if cached is None or cached[0] is not cosmo:
+        if len(_fiducial_filter_cache) > 16: _fiducial_filter_cache.clear()
+        filter = PowerSpectrumBAOFilter(pk_interpolator, engine=engine, cosmo=cosmo, cosmo_fid=cosmo)
+        cached = _fiducial_filter_cache[key] = (cosmo, filter, filter.smooth_pk_interpolator())
+    return cached[1], cached[2]
+
+
 class BasePowerSpectrumExtractor(BaseCalculator):
 
     """Base class to extract shape parameters from linear power spectrum."""
@@ -34,8 +80,7 @@ class BasePowerSpectrumExtractor(BaseCalculator):
         self.cosmo = cosmo
         params = self.params.select(derived=True)
         if is_external_cosmo(self.cosmo):
-            self.cosmo_requires = {'fourier': {'sigma8_z': {'z': self.z, 'of': [('delta_cb', 'delta_cb'), ('theta_cb', 'theta_cb')]},
-                                               'pk_interpolator': {'z': self.z, 'of': [('delta_cb', 'delta_cb')]}}, 'thermodynamics': {'rs_drag': None}}
+            self.cosmo_requires = _base_cosmo_requires(self.z)
         elif cosmo is None:
             self.cosmo = Cosmoprimo(fiducial=self.fiducial)
             self.cosmo.init.params = [param for param in self.params if param not in params]
@@ -43,8 +88,20 @@ class BasePowerSpectrumExtractor(BaseCalculator):
         BasePowerSpectrumExtractor._set_base(self, fiducial=True)
         self.with_now = with_now
         if self.with_now:
-            self.filter = PowerSpectrumBAOFilter(self.pk_dd_interpolator_fid, engine=self.with_now, cosmo=self.fiducial, cosmo_fid=self.fiducial)
-            self.pknow_dd_interpolator_fid = self.filter.smooth_pk_interpolator()
+            self.filter, self.pknow_dd_interpolator_fid = _fiducial_bao_filter(self.pk_dd_interpolator_fid, self.with_now, self.fiducial, self.z)
+
+    def _cosmo_key(self):
+        # Scalar cosmological parameter values, or None if they cannot be extracted (external cosmo, jax tracers)
+        runtime_info = getattr(self.cosmo, 'runtime_info', None)
+        if runtime_info is None:
+            return None
+        values = []
+        for name, value in runtime_info.input_values.items():
+            value = to_nparray(value)
+            if value is None or value.ndim != 0:
+                return None
+            values.append((name, value.item()))
+        return tuple(values)
 
     def _set_base(self, fiducial=False, with_now=False):
         cosmo = self.fiducial if fiducial else self.cosmo
@@ -59,10 +116,13 @@ class BasePowerSpectrumExtractor(BaseCalculator):
         k0 = 1e-3
         state['f0'] = np.sqrt(state['pk_tt_interpolator'](k0) / state['pk_dd_interpolator'](k0))
         if hasattr(self, 'k'):  # ShapeFitPowerSpectrumExtractor has no k
-            state['fk'] = np.sqrt(state['pk_tt_interpolator'](self.k) / state['pk_dd_interpolator'](self.k))
+            state['pk_dd'] = state['pk_dd_interpolator'](self.k)  # keep the evaluation needed for fk anyway
+            state['fk'] = np.sqrt(state['pk_tt_interpolator'](self.k) / state['pk_dd'])
         if with_now:
             self.filter(state['pk_dd_interpolator'], cosmo=cosmo)
             state['pknow_dd_interpolator'] = self.filter.smooth_pk_interpolator()
+            if hasattr(self, 'k'):
+                state['pknow_dd'] = state['pknow_dd_interpolator'](self.k)
         for name, value in state.items(): setattr(self, name + ('_fid' if fiducial else ''), value)
 
 
@@ -77,8 +137,9 @@ class BasePowerSpectrumTemplate(BasePowerSpectrumExtractor):
     def initialize(self, k=None, z=1., with_now=False, apmode='qparqper', fiducial='DESI', only_now=False, eta=1. / 3., cosmo=None):
         self.z = np.asarray(z, dtype='f8')
         self.cosmo = self.fiducial = get_cosmo(fiducial)
-        if k is None: k = np.logspace(-3., 1., 400)
+        if k is None: k = _k_default
         self.k = np.array(k, dtype='f8')
+        self._logk = np.log10(self.k)  # fixed grid: precompute the interpolation coordinates
         self.cosmo_requires = {}
         self.apeffect = APEffect(z=self.z, fiducial=self.fiducial, mode=apmode, eta=eta, cosmo=cosmo)
         ap_params = ParameterCollection()
@@ -94,10 +155,9 @@ class BasePowerSpectrumTemplate(BasePowerSpectrumExtractor):
                 only_now = 'peakaverage'  # default
             self.with_now = only_now
         self.only_now = bool(only_now)
-        self.pk_dd_fid = self.pk_dd_interpolator_fid(self.k)
+        # pk_dd_fid has been set by _set_base above, together with fk_fid, from a single interpolator evaluation
         if self.with_now:
-            self.filter = PowerSpectrumBAOFilter(self.pk_dd_interpolator_fid, engine=self.with_now, cosmo=self.fiducial, cosmo_fid=self.fiducial)
-            self.pknow_dd_interpolator_fid = self.filter.smooth_pk_interpolator()
+            self.filter, self.pknow_dd_interpolator_fid = _fiducial_bao_filter(self.pk_dd_interpolator_fid, self.with_now, self.fiducial, self.z)
             self.pknow_dd_fid = self.pknow_dd_interpolator_fid(self.k)
 
     def calculate(self):
@@ -167,7 +227,9 @@ class BasePowerSpectrumTemplate(BasePowerSpectrumExtractor):
         else:
             class TmpAPEffect(object): pass
             TmpAPEffect.ap_k_mu = APEffect.ap_k_mu
+            TmpAPEffect._ap_cached = APEffect._ap_cached
             state['apeffect'] = tmpap = TmpAPEffect()
+            tmpap._ap_cache = {}
         tmpap.qpar, tmpap.qper, tmpap.eta = state.pop('qpar'), state.pop('qper'), state.pop('eta')
         self.__dict__.update(state)
 
@@ -234,8 +296,7 @@ class DirectPowerSpectrumTemplate(BasePowerSpectrumTemplate):
         params = self.init.params.select(derived=True)
         if is_external_cosmo(self.cosmo):
             # cosmo_requires only used for external bindings (cobaya, cosmosis, montepython): specifies the input theory requirements
-            self.cosmo_requires = {'fourier': {'sigma8_z': {'z': self.z, 'of': [('delta_cb', 'delta_cb'), ('theta_cb', 'theta_cb')]},
-                                               'pk_interpolator': {'z': self.z, 'k': self.k, 'of': [('delta_cb', 'delta_cb')]}}, 'thermodynamics': {'rs_drag': None}}
+            self.cosmo_requires = _base_cosmo_requires(self.z, k=self.k)
         elif cosmo is None:
             self.cosmo = Cosmoprimo(fiducial=self.fiducial, engine=engine)
             # transfer the parameters of the template (Omega_m, logA, h, etc.) to Cosmoprimo
@@ -246,16 +307,20 @@ class DirectPowerSpectrumTemplate(BasePowerSpectrumTemplate):
         if is_external_cosmo(self.cosmo):
             # update cosmo_requires with background quantities
             self.cosmo_requires.update(self.apeffect.cosmo_requires)
+        self._cosmo_cache_key = None
 
     def calculate(self):
-        # compute the power spectrum for the current cosmo
+        # compute the power spectrum for the current cosmo;
+        # skip the interpolator rebuild and evaluations when the cosmology did not change
+        key = self._cosmo_key()
+        if key is not None and key == self._cosmo_cache_key:
+            return
         BasePowerSpectrumExtractor._set_base(self, with_now=self.with_now)
-        self.pk_dd = self.pk_dd_interpolator(self.k)
-        if self.with_now:
-            self.pknow_dd = self.pknow_dd_interpolator(self.k)
+        # pk_dd (and pknow_dd if with_now) have been evaluated by _set_base, alongside fk
         if self.only_now:  # only used if we want to take wiggles out of our model (e.g. for BAO)
-            for name in ['dd_interpolator', 'dd']:
-                setattr(self, 'pk_' + name, getattr(self, 'pknow_' + name))
+            self.pk_dd_interpolator = self.pknow_dd_interpolator
+            self.pk_dd = self.pknow_dd
+        self._cosmo_cache_key = key
 
 
 class BAOExtractor(BasePowerSpectrumExtractor):
@@ -294,6 +359,7 @@ class BAOExtractor(BasePowerSpectrumExtractor):
 
     def initialize(self, z=1., eta=1. / 3., cosmo=None, fiducial='DESI', rs_drag_varied=False):
         self.z = np.asarray(z, dtype='f8')
+        self._z_cbrt = self.z ** (1. / 3.)
         self.eta = float(eta)
         self.fiducial = get_cosmo(fiducial)
         self.cosmo_requires = {}
@@ -316,9 +382,12 @@ class BAOExtractor(BasePowerSpectrumExtractor):
         cosmo = self.fiducial if fiducial else self.cosmo
         state = {}
         state['rd'] = cosmo.rs_drag if rs_drag is None else rs_drag
-        state['DH'] = (constants.c / 1e3) / (100. * cosmo.efunc(self.z))
+        state['DH'] = _c_over_100 / cosmo.efunc(self.z)
         state['DM'] = cosmo.comoving_angular_distance(self.z)
-        state['DV'] = state['DH']**self.eta * state['DM']**(1. - self.eta) * self.z**(1. / 3.)
+        # _z_cbrt may not be set when called from the ShapeFit classes, which do not go through BAOExtractor.initialize
+        z_cbrt = getattr(self, '_z_cbrt', None)
+        if z_cbrt is None: z_cbrt = self.z ** (1. / 3.)
+        state['DV'] = state['DH']**self.eta * state['DM']**(1. - self.eta) * z_cbrt
         state['DH_over_rd'] = state['DH'] / state['rd']
         state['DM_over_rd'] = state['DM'] / state['rd']
         state['DH_over_DM'] = state['DH'] / state['DM']
@@ -368,6 +437,7 @@ class BAOPowerSpectrumTemplate(BasePowerSpectrumTemplate):
         super(BAOPowerSpectrumTemplate, self).initialize(*args, with_now=with_now, **kwargs)
         # Set DM_over_rd, etc.
         BAOExtractor._set_base(self, fiducial=True)
+        self._q_cache_key = None
 
     def calculate(self, df=1.):
         super(BAOPowerSpectrumTemplate, self).calculate()
@@ -376,10 +446,18 @@ class BAOPowerSpectrumTemplate(BasePowerSpectrumTemplate):
         self.fk = self.fk_fid * df
 
     def get(self):
+        # skip rescaling the fiducial distances when the AP parameters did not change; jax tracers disable the cache
+        key = None
+        qpar, qper = to_nparray(self.qpar), to_nparray(self.qper)
+        if qpar is not None and qper is not None and qpar.ndim == 0 and qper.ndim == 0:
+            key = (qpar.item(), qper.item())
+        if key is not None and key == self._q_cache_key:
+            return self
         self.DH_over_rd = self.qpar * self.DH_over_rd_fid
         self.DM_over_rd = self.qper * self.DM_over_rd_fid
         self.DV_over_rd = self.qpar**self.eta * self.qper**(1. - self.eta) * self.DV_over_rd_fid
         self.DH_over_DM = self.qpar / self.qper * self.DH_over_DM_fid
+        self._q_cache_key = key
         return self
 
     def __getstate__(self):
@@ -653,9 +731,15 @@ class ShapeFitPowerSpectrumExtractor(BasePowerSpectrumExtractor):
             self.cosmo_requires['background'] = {'efunc': {'z': self.z}, 'comoving_angular_distance': {'z': self.z}}
         self.eta = float(eta)
         self._set_base(fiducial=True)
+        self._cosmo_cache_key = None
 
     def calculate(self):
+        # skip the interpolator evaluations when the cosmology did not change
+        key = self._cosmo_key()
+        if key is not None and key == self._cosmo_cache_key:
+            return
         self._set_base()
+        self._cosmo_cache_key = key
 
     def _set_base(self, fiducial=False):
         BasePowerSpectrumExtractor._set_base(self, fiducial=fiducial, with_now=True)
@@ -665,22 +749,23 @@ class ShapeFitPowerSpectrumExtractor(BasePowerSpectrumExtractor):
         kp = self.kp / s
         state = {}
         state['n'] = cosmo.n_s
-        dk = 1e-2
-        k = kp * np.array([1. - dk, 1. + dk])
+        k = kp * _k_stencil_unit
         # No need to include 1/s^3 factors here, as we care about the slope
         if self.n_varied: pk_prim = cosmo.get_primordial().pk_interpolator()(k) * k
-        else: pk_prim = np.ones_like(k)
         suffix = '_fid' if fiducial else ''
         pknow_dd_interpolator = getattr(self, 'pknow_dd_interpolator' + suffix)
         f = getattr(self, 'f' + suffix)
         pknow_dd = pknow_dd_interpolator(k)
-        state['m'] = np.diff(np.log(pknow_dd / _bcast_shape(pk_prim, pknow_dd.shape, axis=0)), axis=0)[0] / np.diff(np.log(k))[0]
+        # 2-point log-slope, written out to avoid the np.diff / np.log temporaries
+        log_pk_prim = math.log(pk_prim[1] / pk_prim[0]) if self.n_varied else 0.
+        state['m'] = (np.log(pknow_dd[1] / pknow_dd[0]) - log_pk_prim) * _inv_dlogk_stencil
         # Eq. 3.11 of https://arxiv.org/abs/2106.07641
         state['Ap'] = 1. / s**3 * pknow_dd_interpolator(kp)
         state['f_sqrt_Ap'] = f * state['Ap']**0.5
         # Eq. 3.11 of https://arxiv.org/pdf/2212.04522.pdf
         dm = state['m'] - getattr(self, 'm_fid', state['m'])
-        state['f_sigmar'] = f * pknow_dd_interpolator.sigma_r(self.r * s) * np.exp(dm / (2 * self.a) * np.tanh(self.a * self.fiducial.rs_drag / self.r))
+        # the tanh argument is a plain float: math.tanh skips the numpy ufunc dispatch
+        state['f_sigmar'] = f * pknow_dd_interpolator.sigma_r(self.r * s) * np.exp(dm / (2 * self.a) * math.tanh(self.a * self.fiducial.rs_drag / self.r))
         for name, value in state.items(): setattr(self, name + suffix, value)
 
     def get(self):
@@ -743,11 +828,24 @@ class ShapeFitPowerSpectrumTemplate(BasePowerSpectrumTemplate):
         self.r = float(r)
         super(ShapeFitPowerSpectrumTemplate, self).initialize(*args, with_now=with_now, **kwargs)
         ShapeFitPowerSpectrumExtractor._set_base(self, fiducial=True)
+        # k, kp and a are fixed: precompute the transcendental tables entering the ShapeFit factor
+        self._logk_over_kp = np.log(self.k / self.kp)
+        self._tanh_term = np.tanh(self.a * self._logk_over_kp) / self.a
+        self._factor_cache = None
 
     def calculate(self, df=1., dm=0., dn=0.):
         super(ShapeFitPowerSpectrumTemplate, self).calculate()
-        factor = _bcast_shape(jnp.exp(dm / self.a * jnp.tanh(self.a * jnp.log(self.k / self.kp)) + dn * jnp.log(self.k / self.kp)), self.pk_dd_fid.shape, axis=0)
-        #factor = np.exp(dm * np.log(self.k / self.kp))
+        # profilers frequently repeat (dm, dn) while perturbing other parameters: reuse the last factor then
+        key = None
+        dm_np, dn_np = to_nparray(dm), to_nparray(dn)
+        if dm_np is not None and dn_np is not None and dm_np.ndim == 0 and dn_np.ndim == 0:
+            key = (dm_np.item(), dn_np.item())
+        if key is not None and self._factor_cache is not None and key == self._factor_cache[0]:
+            factor = self._factor_cache[1]
+        else:
+            factor = _bcast_shape(jnp.exp(dm * self._tanh_term + dn * self._logk_over_kp), self.pk_dd_fid.shape, axis=0)
+            #factor = np.exp(dm * np.log(self.k / self.kp))
+            if key is not None: self._factor_cache = (key, factor)
         self.pk_dd = self.pk_dd_fid * factor
         if self.with_now:
             self.pknow_dd = self.pknow_dd_fid * factor
@@ -1068,12 +1166,33 @@ def integrate_sigma_r2(r, pk, kmin=1e-6, kmax=1e2, nk=2048, kernel=kernel_tophat
     sigmar2 : float
         Variance of perturbations.
     """
+    k, k3w = _sigma_r2_grid(float(kmin), float(kmax), int(nk))
+    integrand = pk(k, **kwargs)
+    kb = _bcast_shape(k, shape=integrand.shape, axis=0)
+    integrand = integrand * kernel(kb * r)
+    # extra k^3 factor (log integration) and trapezoid weights are folded into k3w
+    return np.tensordot(k3w, integrand, axes=(0, 0))
+
+
+def _integrate_sigma_r2_kernels(r, pk, kernels, kmin=1e-6, kmax=1e2, nk=2048, **kwargs):
+    # Same as :func:`integrate_sigma_r2` for several kernels at once,
+    # sharing the power spectrum evaluation on the quadrature grid
+    k, k3w = _sigma_r2_grid(float(kmin), float(kmax), int(nk))
+    integrand = pk(k, **kwargs)
+    kb = _bcast_shape(k, shape=integrand.shape, axis=0)
+    return [np.tensordot(k3w, integrand * kernel(kb * r), axes=(0, 0)) for kernel in kernels]
+
+
+@functools.lru_cache(maxsize=16)
+def _sigma_r2_grid(kmin, kmax, nk):
+    # k grid, k^3 log-integration factor, trapezoid weights and normalization only depend on the binning
     logk = np.linspace(np.log10(kmin), np.log10(kmax), nk)
     k = np.exp(logk)
-    integrand = pk(k, **kwargs)
-    k = _bcast_shape(k, shape=integrand.shape, axis=0)
-    integrand *= kernel(k * r) * k**3  # extra k factor because log integration
-    return 1. / 2. / np.pi**2 * np.trapz(integrand, x=logk, axis=0)
+    weights = np.zeros_like(logk)
+    dlogk = np.diff(logk)
+    weights[:-1] += dlogk / 2.
+    weights[1:] += dlogk / 2.
+    return k, 1. / 2. / np.pi**2 * k**3 * weights
 
 
 class WiggleSplitPowerSpectrumExtractor(BasePowerSpectrumExtractor):
@@ -1133,10 +1252,11 @@ class WiggleSplitPowerSpectrumExtractor(BasePowerSpectrumExtractor):
         state = {}
         state['pk_tt_interpolator'] = fo.pk_interpolator(of='theta_cb', **_kw_interp)
         state['pk_dd_interpolator'] = fo.pk_interpolator(of='delta_cb', **_kw_interp)
-        state['fsigmar'] = integrate_sigma_r2(r, state['pk_tt_interpolator'], kernel=self.kernel)**0.5
+        fsigmar2, dfsigmar2 = _integrate_sigma_r2_kernels(r, state['pk_tt_interpolator'], (self.kernel, self.kernel_deriv))
+        state['fsigmar'] = fsigmar2**0.5
         state['sigmar'] = integrate_sigma_r2(r, state['pk_dd_interpolator'], kernel=self.kernel)**0.5
         state['f'] = state['fsigmar'] / state['sigmar']
-        state['m'] = - integrate_sigma_r2(r, state['pk_tt_interpolator'], kernel=self.kernel_deriv) / state['fsigmar']**2 - 3.
+        state['m'] = - dfsigmar2 / fsigmar2 - 3.
         for name, value in state.items(): setattr(self, name + ('_fid' if fiducial else ''), value)
 
     def get(self):
@@ -1183,6 +1303,11 @@ class WiggleSplitPowerSpectrumTemplate(BasePowerSpectrumTemplate):
         WiggleSplitPowerSpectrumExtractor._set_base(self, fiducial=True)
         self.filter = PowerSpectrumBAOFilter(self.pk_tt_interpolator_fid, engine=self.with_now, cosmo=self.cosmo, cosmo_fid=self.fiducial)
         self.pknow_tt_interpolator_fid = self.filter.smooth_pk_interpolator()
+        # fiducial quantities on the internal grid are fixed: evaluate them once
+        k = np.geomspace(self.pk_dd_interpolator_fid.extrap_kmin, self.pk_dd_interpolator_fid.extrap_kmax, 2000)
+        self._kgrid = k = k[(k > k[0] * 2.) & (k < k[-1] / 2.)]  # to avoid hitting boundaries with qbao
+        self._pknow_tt_grid = self.pknow_tt_interpolator_fid(k)
+        self._wiggle_cache_key = None
 
     def calculate(self, df=1., dm=0., qbao=1.):
         super(WiggleSplitPowerSpectrumTemplate, self).calculate()
@@ -1190,20 +1315,27 @@ class WiggleSplitPowerSpectrumTemplate(BasePowerSpectrumTemplate):
         self.f0 = self.f0_fid * df
         self.fk = self.fk_fid * df
         kp = 0.05
-        k = k = np.geomspace(self.pk_dd_interpolator_fid.extrap_kmin, self.pk_dd_interpolator_fid.extrap_kmax, 2000)
-        k = k[(k > k[0] * 2.) & (k < k[-1] / 2.)]  # to avoid hitting boundaries with qbao
-        factor = (k / kp)**dm
-        pknow_tt = self.pknow_tt_interpolator_fid(k)
-        wiggles = self.pk_tt_interpolator_fid(k / qbao) - self.pknow_tt_interpolator_fid(k / qbao)
-        factor = _bcast_shape(factor, pknow_tt.shape, axis=0)
-        pk_tt_interpolator = PowerSpectrumInterpolator1D(k, (pknow_tt + wiggles) * factor)
-        norm = df**2 * self.fsigmar_fid**2 / integrate_sigma_r2(self.r, pk_tt_interpolator, kernel=self.kernel)
-        self.pk_tt = pk_tt_interpolator(self.k) * norm
+        # the splines and sigma_r integrals only depend on (dm, qbao): rebuild them when these change;
+        # jax tracers disable the cache
+        key, values = None, [to_nparray(value) for value in (dm, qbao)]
+        if all(value is not None and value.ndim == 0 for value in values):
+            key = tuple(value.item() for value in values)
+        if key is None or key != self._wiggle_cache_key:
+            k, pknow_tt = self._kgrid, self._pknow_tt_grid
+            factor = _bcast_shape((k / kp)**dm, pknow_tt.shape, axis=0)
+            wiggles = self.pk_tt_interpolator_fid(k / qbao) - self.pknow_tt_interpolator_fid(k / qbao)
+            pk_tt_interpolator = PowerSpectrumInterpolator1D(k, (pknow_tt + wiggles) * factor)
+            cache = (pk_tt_interpolator(self.k), integrate_sigma_r2(self.r, pk_tt_interpolator, kernel=self.kernel))
+            if self.with_now:
+                pknow_tt_interpolator = PowerSpectrumInterpolator1D(k, pknow_tt * factor)
+                cache += (pknow_tt_interpolator(self.k), integrate_sigma_r2(self.r, pknow_tt_interpolator, kernel=self.kernel))
+            self._wiggle_cache, self._wiggle_cache_key = cache, key
+        norm = df**2 * self.fsigmar_fid**2 / self._wiggle_cache[1]
+        self.pk_tt = self._wiggle_cache[0] * norm
         self.pk_dd = self.pk_tt / self.f**2
         if self.with_now:
-            pknow_tt_interpolator = PowerSpectrumInterpolator1D(k, pknow_tt * factor)
-            norm = df * self.fsigmar_fid**2 / integrate_sigma_r2(self.r, pknow_tt_interpolator, kernel=self.kernel)
-            self.pknow_tt = pknow_tt_interpolator(self.k) * norm
+            norm = df * self.fsigmar_fid**2 / self._wiggle_cache[3]
+            self.pknow_tt = self._wiggle_cache[2] * norm
             self.pknow_dd = self.pknow_tt / self.f**2
         if self.only_now:
             for name in ['dd', 'tt']:
@@ -1217,7 +1349,9 @@ class WiggleSplitPowerSpectrumTemplate(BasePowerSpectrumTemplate):
 def find_turn_over(pk_interpolator, **kwargs):
     # Find turn over, with parabolic interpolation
     k = pk_interpolator.k
-    pk = pk_interpolator(k, **kwargs)
+    pk = getattr(pk_interpolator, 'pk', None) if not kwargs else None
+    if not isinstance(pk, np.ndarray):  # no knot table exposed: evaluating the spline at its own knots gives the same values
+        pk = pk_interpolator(k, **kwargs)
     imax = np.argmax(pk, axis=0).flat[0]
     logk = np.log10(k[imax - 1:imax + 2])
     logpk = np.log10(pk[imax - 1:imax + 2])
@@ -1380,8 +1514,7 @@ class DirectWiggleSplitPowerSpectrumTemplate(BasePowerSpectrumTemplate):
         params = self.init.params.select(derived=True) + self.init.params.select(basename=['qbao', 'sigmabao'])
         if is_external_cosmo(self.cosmo):
             # cosmo_requires only used for external bindings (cobaya, cosmosis, montepython): specifies the input theory requirements
-            self.cosmo_requires = {'fourier': {'sigma8_z': {'z': self.z, 'of': [('delta_cb', 'delta_cb'), ('theta_cb', 'theta_cb')]},
-                                               'pk_interpolator': {'z': self.z, 'k': self.k, 'of': [('delta_cb', 'delta_cb')]}}, 'thermodynamics': {'rs_drag': None}}
+            self.cosmo_requires = _base_cosmo_requires(self.z, k=self.k)
         elif cosmo is None:
             self.cosmo = Cosmoprimo(fiducial=self.fiducial)
             # transfer the parameters of the template (Omega_m, logA, h, etc.) to Cosmoprimo
@@ -1392,14 +1525,20 @@ class DirectWiggleSplitPowerSpectrumTemplate(BasePowerSpectrumTemplate):
         if is_external_cosmo(self.cosmo):
             # update cosmo_requires with background quantities
             self.cosmo_requires.update(self.apeffect.cosmo_requires)
+        self._cosmo_cache_key = None
 
     def calculate(self, qbao=1., sigmabao=0.):
-        # compute the power spectrum for the current cosmo
-        BasePowerSpectrumExtractor._set_base(self, with_now=True)
-        k = self.pk_dd_interpolator.k
-        wiggles = _interp(self.k / qbao, k, self.pk_dd_interpolator(k) - self.pknow_dd_interpolator(k))
+        # compute the power spectrum for the current cosmo; the (expensive) wiggle / no-wiggle split
+        # only depends on the cosmology, so qbao, sigmabao steps reuse it
+        key = self._cosmo_key()
+        if key is None or key != self._cosmo_cache_key:
+            BasePowerSpectrumExtractor._set_base(self, with_now=True)  # also evaluates pknow_dd on the self.k grid
+            k = self.pk_dd_interpolator.k
+            self._wiggles_split = (k, self.pk_dd_interpolator(k) - self.pknow_dd_interpolator(k))
+            self._cosmo_cache_key = key
+        k, wiggles = self._wiggles_split
+        wiggles = _interp(self.k / qbao, k, wiggles)
         wiggles *= _bcast_shape(jnp.exp(- (self.k * sigmabao)**2), wiggles.shape, axis=0)
-        self.pknow_dd = self.pknow_dd_interpolator(self.k)
         self.pk_dd = self.pknow_dd + wiggles
         if self.only_now:  # only used if we want to take wiggles out of our model (e.g. for BAO)
             for name in ['dd']:
@@ -1,3 +1,5 @@
+import functools
+
 import numpy as np
 from scipy import optimize
 
@@ -18,6 +20,12 @@ def convert(params):
     return {conversions.get(name, name): value for name, value in params.items()}
 
 
+@functools.lru_cache(maxsize=16)
+def _get_fiducial(name, params):
+    import cosmoprimo
+    return getattr(cosmoprimo.fiducial, name)(**dict(params))
+
+
 def get_cosmo(cosmo):
     if cosmo is None:
         return cosmo
@@ -27,7 +35,13 @@ def get_cosmo(cosmo):
     if isinstance(cosmo, str):
         cosmo = (cosmo, {})
     if isinstance(cosmo, tuple):
-        return getattr(cosmoprimo.fiducial, cosmo[0])(**cosmo[1])
+        # Share the instance across calculators built from the same specifications:
+        # cosmoprimo caches engines and derived quantities on the Cosmology,
+        # so the fiducial-dependent setup is paid only once per session
+        try:
+            return _get_fiducial(cosmo[0], tuple(sorted(cosmo[1].items())))
+        except TypeError:  # unhashable parameter values
+            return getattr(cosmoprimo.fiducial, cosmo[0])(**cosmo[1])
     return cosmoprimo.Cosmology(**convert(cosmo))
 
 
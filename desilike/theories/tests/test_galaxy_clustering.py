@@ -1,8 +1,27 @@
+import os
+
 import numpy as np
 
 from desilike import setup_logging
 
 
+# shared band-power pivot grid, allocated once and frozen (the templates copy it)
+_kp_default = np.linspace(0.01, 0.1, 10)
+_kp_default.setflags(write=False)
+
+
+def _plot_tests():
+    # plotting blocks are opt-in: run pytest with --plot, or set DESILIKE_PLOT_TESTS=1
+    return bool(os.environ.get('DESILIKE_PLOT_TESTS'))
+
+
+def _show():
+    # figures are still built (cheap on headless backends); only the blocking flush is opt-in
+    if _plot_tests():
+        from matplotlib import pyplot as plt
+        plt.show()
+
+
 def test_integ():
     from desilike.theories.galaxy_clustering.base import BaseTheoryPowerSpectrumMultipolesFromWedges
     from desilike.theories.galaxy_clustering import StandardPowerSpectrumTemplate, KaiserTracerPowerSpectrumMultipoles
@@ -55,7 +74,7 @@ def test_templates():
     x = np.linspace(0., 0.2, 100)
     plt.plot(x, kernel_tophat2(x))
     plt.plot(x, kernel_tophat2_deriv(x))
-    plt.show()
+    _show()
     """
     k = np.logspace(-2, 1, 100)
     n = -2.
@@ -108,7 +127,7 @@ def test_templates():
     for template in [FixedPowerSpectrumTemplate(), DirectPowerSpectrumTemplate(), BAOPowerSpectrumTemplate(), BAOPhaseShiftPowerSpectrumTemplate(),
                      StandardPowerSpectrumTemplate(), ShapeFitPowerSpectrumTemplate(), ShapeFitPowerSpectrumTemplate(apmode='qisoqap'),
                      WiggleSplitPowerSpectrumTemplate(), WiggleSplitPowerSpectrumTemplate(kernel='tophat'), DirectWiggleSplitPowerSpectrumTemplate(),
-                     BandVelocityPowerSpectrumTemplate(kp=np.linspace(0.01, 0.1, 10)), TurnOverPowerSpectrumTemplate()]:
+                     BandVelocityPowerSpectrumTemplate(kp=_kp_default), TurnOverPowerSpectrumTemplate()]:
         print(template)
         theory = KaiserTracerPowerSpectrumMultipoles(template=template)
         theory()
@@ -130,7 +149,7 @@ def test_templates():
     for extractor in [BAOExtractor(), BAOPhaseShiftExtractor(), StandardPowerSpectrumExtractor(),
                       ShapeFitPowerSpectrumExtractor(), ShapeFitPowerSpectrumExtractor(dfextractor='fsigmar'),
                       WiggleSplitPowerSpectrumExtractor(), WiggleSplitPowerSpectrumExtractor(kernel='tophat'),
-                      BandVelocityPowerSpectrumExtractor(kp=np.linspace(0.01, 0.1, 10)), TurnOverPowerSpectrumExtractor()]:
+                      BandVelocityPowerSpectrumExtractor(kp=_kp_default), TurnOverPowerSpectrumExtractor()]:
         extractor()
 
 
@@ -156,7 +175,7 @@ def test_wiggle_split_template():
         ax.grid(True)
         ax.set_xlabel(r'$k$ [$h/\mathrm{Mpc}$]')
         ax.set_ylabel(r'$k P_{\ell}(k)$ [$(\mathrm{Mpc}/h)^{2}$]')
-    plt.show()
+    _show()
 
 
 def test_emulator_templates():
@@ -292,7 +311,7 @@ def test_bao():
     theory(sigmas=3.)
     fig = theory.plot()
     theory(sigmas=6.)
-    theory.plot(fig=fig, show=True)
+    theory.plot(fig=fig, show=_plot_tests())
 
     test(SimpleBAOWigglesTracerPowerSpectrumMultipoles())
     test(DampedBAOWigglesTracerPowerSpectrumMultipoles())
@@ -311,7 +330,7 @@ def test_flexible_bao():
 
     from desilike.theories.galaxy_clustering import FlexibleBAOWigglesTracerPowerSpectrumMultipoles, FlexibleBAOWigglesTracerCorrelationFunctionMultipoles
 
-    if False:
+    if _plot_tests():
         fig, lax = plt.subplots(1, 2, sharex=False, sharey=True, figsize=(10, 4), squeeze=True)
         fig.subplots_adjust(wspace=0.25)
         theory = FlexibleBAOWigglesTracerPowerSpectrumMultipoles(ells=(0,), broadband='pcs', wiggles='pcs')
@@ -329,9 +348,9 @@ def test_flexible_bao():
             ax.set_xlabel(r'$k$ [$h/\mathrm{Mpc}$]')
             ax.set_ylabel(r'$k P_{\ell}(k)$ [$(\mathrm{Mpc}/h)^{2}$]')
             ax.set_title(mode)
-        plt.show()
+        _show()
 
-    if True:
+    if _plot_tests():
         fig, lax = plt.subplots(1, 2, sharex=False, sharey=True, figsize=(10, 4), squeeze=True)
         fig.subplots_adjust(wspace=0.25)
         theory = FlexibleBAOWigglesTracerCorrelationFunctionMultipoles(ells=(0, 2), broadband='pcs', wiggles='pcs')
@@ -349,7 +368,7 @@ def test_flexible_bao():
             ax.set_xlabel(r'$s$ [$\mathrm{Mpc}/h$]')
             ax.set_ylabel(r'$s^{2} \xi_{\ell}(s)$ [$(\mathrm{Mpc}/h)^{2}$]')
             ax.set_title(mode)
-        plt.show()
+        _show()
 
 
 def test_broadband_bao():
@@ -358,7 +377,7 @@ def test_broadband_bao():
 
     from desilike.theories.galaxy_clustering import DampedBAOWigglesTracerPowerSpectrumMultipoles, DampedBAOWigglesTracerCorrelationFunctionMultipoles
 
-    if False:
+    if _plot_tests():
         ax = plt.gca()
         theory = DampedBAOWigglesTracerPowerSpectrumMultipoles(ells=(0, 2), k=np.linspace(0.001, 0.4, 100), broadband='pcs')
         for ill, ell in enumerate(theory.ells):
@@ -372,9 +391,9 @@ def test_broadband_bao():
         ax.grid(True)
         ax.set_xlabel(r'$k$ [$h/\mathrm{Mpc}$]')
         ax.set_ylabel(r'$k P_{\ell}(k)$ [$(\mathrm{Mpc}/h)^{2}$]')
-        plt.show()
+        _show()
 
-    if False:
+    if _plot_tests():
         ax = plt.gca()
         theory = DampedBAOWigglesTracerCorrelationFunctionMultipoles(ells=(0, 2), broadband='pcs')
         for ill, ell in enumerate(theory.ells):
@@ -389,9 +408,9 @@ def test_broadband_bao():
         ax.grid(True)
         ax.set_xlabel(r'$s$ [$\mathrm{Mpc}/h$]')
         ax.set_ylabel(r'$s^{2} \xi_{\ell}(s)$ [$(\mathrm{Mpc}/h)^{2}$]')
-        plt.show()
+        _show()
 
-    if True:
+    if _plot_tests():
         fig, lax = plt.subplots(1, 2, sharex=False, sharey=True, figsize=(10, 4), squeeze=True)
         fig.subplots_adjust(wspace=0.25)
 
@@ -426,7 +445,7 @@ def test_broadband_bao():
             ax.legend()
             ax.set_xlabel(r'$s$ [$\mathrm{Mpc}/h$]')
             ax.set_ylabel(r'$s^{2} \xi_{\ell}(s)$ [$(\mathrm{Mpc}/h)^{2}$]')
-        plt.show()
+        _show()
 
 
 def test_full_shape():
@@ -700,7 +719,7 @@ def test_tns():
             ax.plot(pyregpt['k'], pyregpt['pk'][:, i], color='C{:d}'.format(i), linestyle='-', label='regpt' if i == 0 else None)
             ax.plot(theory_tns.pt.k, theory_tns.pt._A[i, :, 0], color='C{:d}'.format(i), linestyle='--', label='desilike' if i == 0 else None)
         ax.legend()
-        plt.show()
+        _show()
 
         pyregpt = B1Loop()
         pyregpt.set_pk_lin(theory_tns.template.k, theory_tns.template.pk_dd)
@@ -712,7 +731,7 @@ def test_tns():
             ax.plot(pyregpt['k'], pyregpt['pk'][:, i], color='C{:d}'.format(i), linestyle='-', label='regpt' if i == 0 else None)
             ax.plot(theory_tns.pt.k, theory_tns.pt._B[i, :, 0], color='C{:d}'.format(i), linestyle='--', label='desilike' if i == 0 else None)
         ax.legend()
-        plt.show()
+        _show()
 
         from pyregpt import Bias1Loop
 
@@ -733,7 +752,7 @@ def test_tns():
             #ax.plot(pyregpt['k'], np.abs(getattr(theory_tns.pt, name)) / np.abs(regptpk), color='C{:d}'.format(i), linestyle='--')
         ax.set_yscale('log')
         ax.legend()
-        plt.show()
+        _show()
 
         fig, lax = plt.subplots(1, 2, sharey=True)
         lax = lax.flatten()
@@ -742,14 +761,14 @@ def test_tns():
             corr = np.sum(theory_tns.pt.pktable[name], axis=0)
             for ill, ell in enumerate(theory.ells):
                 ax.plot(theory_tns.pt.k, corr[ill] / theory.power[ill], color='C{:d}'.format(ill))
-        plt.show()
+        _show()
 
         ax = plt.gca()
         mask = k < 0.3
         for ill, ell in enumerate(theory.ells):
             ax.plot(theory.k[mask], theory.k[mask] * theory.power[ill][mask], color='C{:d}'.format(ill))
             ax.plot(theory_tns.k[mask], theory_tns.k[mask] * theory_tns.power[ill][mask], color='C{:d}'.format(ill), linestyle='--')
-        plt.show()
+        _show()
     """
     theory = EFTLikeTNSTracerPowerSpectrumMultipoles(template=ShapeFitPowerSpectrumTemplate(z=0.5))
 
@@ -778,38 +797,49 @@ def test_freedom():
         for name in ['b2p', 'bsp', 'b3p']:
             assert name in theory.all_params
 
+    cases = [(TheoryPower, TheoryCorr, freedom, ells)
+             for TheoryPower, TheoryCorr in zip([LPTVelocileptorsTracerPowerSpectrumMultipoles, REPTVelocileptorsTracerPowerSpectrumMultipoles, PyBirdTracerPowerSpectrumMultipoles, FOLPSTracerPowerSpectrumMultipoles, FOLPSAXTracerPowerSpectrumMultipoles],
+                                                [LPTVelocileptorsTracerCorrelationFunctionMultipoles, REPTVelocileptorsTracerCorrelationFunctionMultipoles, PyBirdTracerCorrelationFunctionMultipoles, FOLPSTracerCorrelationFunctionMultipoles, FOLPSAXTracerCorrelationFunctionMultipoles])
+             for freedom in [None, 'min', 'max']
+             for ells in [(0, 2), (0, 2, 4)]]
+    # cases are independent; opt-in parallel sweep (serial default keeps debuggers usable)
+    if os.environ.get('DESILIKE_PARALLEL_TESTS'):
+        from joblib import Parallel, delayed
+        Parallel(n_jobs=min(8, os.cpu_count() or 1), backend='loky')(delayed(_test_freedom_case)(*case) for case in cases)
+    else:
+        for case in cases:
+            _test_freedom_case(*case)
+
+
+def _test_freedom_case(TheoryPower, TheoryCorr, freedom, ells):
     ntemplate = 4
-    for TheoryPower, TheoryCorr in zip([LPTVelocileptorsTracerPowerSpectrumMultipoles, REPTVelocileptorsTracerPowerSpectrumMultipoles, PyBirdTracerPowerSpectrumMultipoles, FOLPSTracerPowerSpectrumMultipoles, FOLPSAXTracerPowerSpectrumMultipoles],
-                                       [LPTVelocileptorsTracerCorrelationFunctionMultipoles, REPTVelocileptorsTracerCorrelationFunctionMultipoles, PyBirdTracerCorrelationFunctionMultipoles, FOLPSTracerCorrelationFunctionMultipoles, FOLPSAXTracerCorrelationFunctionMultipoles]):
-        for freedom in [None, 'min', 'max']:
-            for ells in [(0, 2), (0, 2, 4)]:
-                kwargs = {}
-                if 'velocileptors' in TheoryPower.__name__.lower():
-                    kwargs.update(prior_basis='standard')
-                power = TheoryPower(ells=ells, freedom=freedom, **kwargs)
-                print('#' * 60)
-                print(TheoryPower.__name__, ells, freedom, power.varied_params)
-                for param in power.varied_params:
-                    print(param, param.prior)
-                fell = 1
-                if 'velocileptors' in TheoryPower.__name__.lower(): fell = 2  # alpha4 and sn4
-                if freedom is not None:
-                    assert len(power.varied_params) == ntemplate + 6 + (4 in ells) * fell + 2 * (freedom == 'max'), (TheoryPower, freedom, ells, power.varied_params)  # 2 (+ 2) bias, 2 (+ 1) EFT, 2 sn
-                corr = TheoryCorr(ells=ells, freedom=freedom, **kwargs)
-                print('#' * 60)
-                print(TheoryCorr.__name__, ells, freedom, corr.varied_params)
-                for param in power.varied_params:
-                    print(param, param.prior)
-                if freedom is not None: assert len(corr.varied_params) == ntemplate + 4 + (4 in ells) + 2 * (freedom == 'max')  # 2 (+ 2) bias, 2 EFT
-                for param in corr.varied_params:
-                    assert param in power.varied_params, '{} not in {}'.format(param, power.varied_params)
-                for theory in [power, corr]:
-                    for param in theory.init.params: param.update(namespace='LRG')
-                    basenames = theory.init.params.basenames()
-                    theory()
-                    for param in theory.all_params:
-                        if param.basename in basenames:
-                            assert param.namespace == 'LRG'
+    kwargs = {}
+    if 'velocileptors' in TheoryPower.__name__.lower():
+        kwargs.update(prior_basis='standard')
+    power = TheoryPower(ells=ells, freedom=freedom, **kwargs)
+    print('#' * 60)
+    print(TheoryPower.__name__, ells, freedom, power.varied_params)
+    for param in power.varied_params:
+        print(param, param.prior)
+    fell = 1
+    if 'velocileptors' in TheoryPower.__name__.lower(): fell = 2  # alpha4 and sn4
+    if freedom is not None:
+        assert len(power.varied_params) == ntemplate + 6 + (4 in ells) * fell + 2 * (freedom == 'max'), (TheoryPower, freedom, ells, power.varied_params)  # 2 (+ 2) bias, 2 (+ 1) EFT, 2 sn
+    corr = TheoryCorr(ells=ells, freedom=freedom, **kwargs)
+    print('#' * 60)
+    print(TheoryCorr.__name__, ells, freedom, corr.varied_params)
+    for param in power.varied_params:
+        print(param, param.prior)
+    if freedom is not None: assert len(corr.varied_params) == ntemplate + 4 + (4 in ells) + 2 * (freedom == 'max')  # 2 (+ 2) bias, 2 EFT
+    for param in corr.varied_params:
+        assert param in power.varied_params, '{} not in {}'.format(param, power.varied_params)
+    for theory in [power, corr]:
+        for param in theory.init.params: param.update(namespace='LRG')
+        basenames = theory.init.params.basenames()
+        theory()
+        for param in theory.all_params:
+            if param.basename in basenames:
+                assert param.namespace == 'LRG'
 
 
 def test_velocileptors_lpt_rsd():
@@ -846,7 +876,7 @@ def test_velocileptors_lpt_rsd():
     ax.legend()
     ax.set_ylabel(r'$k \Delta P_{\ell}(k)$ [$(\mathrm{Mpc}/h)^{2}$]')
     ax.set_xlabel(r'$k$ [$h/\mathrm{Mpc}$]')
-    plt.show()
+    _show()
 
     stoch = [0, 0, 0]
     pars = biases + cterms + stoch
@@ -875,7 +905,7 @@ def test_velocileptors_lpt_rsd():
     ax.legend()
     ax.set_ylabel(r'$s^{2} \xi_{\ell}(s)$ [$(\mathrm{Mpc}/h)^{2}$]')
     ax.set_xlabel(r'$s$ [$\mathrm{Mpc}/h$]')
-    plt.show()
+    _show()
 
 
 def test_velocileptors_rept():
@@ -917,7 +947,7 @@ def test_velocileptors_rept():
     ax.legend()
     ax.set_ylabel(r'$k \Delta P_{\ell}(k)$ [$(\mathrm{Mpc}/h)^{2}$]')
     ax.set_xlabel(r'$k$ [$h/\mathrm{Mpc}$]')
-    plt.show()
+    _show()
     exit()
 
     import time
@@ -962,7 +992,7 @@ def test_velocileptors_rept():
     ax.legend()
     ax.set_ylabel(r'$k \Delta P_{\ell}(k)$ [$(\mathrm{Mpc}/h)^{2}$]')
     ax.set_xlabel(r'$k$ [$h/\mathrm{Mpc}$]')
-    plt.show()
+    _show()
 
     from desilike.observables.galaxy_clustering import TracerPowerSpectrumMultipolesObservable
     from desilike.observables import ObservableArray, ObservableCovariance
@@ -1036,7 +1066,7 @@ def test_pybird():
     ax.legend()
     ax.set_ylabel(r'$k \Delta P_{\ell}(k)$ [$(\mathrm{Mpc}/h)^{2}$]')
     ax.set_xlabel(r'$k$ [$h/\mathrm{Mpc}$]')
-    plt.show()
+    _show()
 
     for eft_basis in ['westcoast', 'eastcoast']:
         theory.init.update(eft_basis=eft_basis)
@@ -1070,7 +1100,7 @@ def test_pybird():
     ax.legend()
     ax.set_ylabel(r'$s^{2} \Delta \xi_{\ell}(s)$ [$(\mathrm{Mpc}/h)^{2}$]')
     ax.set_xlabel(r'$s$ [$\mathrm{Mpc}/h$]')
-    plt.show()
+    _show()
 
     for eft_basis in ['westcoast', 'eastcoast']:
         theory.init.update(eft_basis=eft_basis)
@@ -1131,12 +1161,12 @@ def test_folps():
         ax.legend()
         ax.set_ylabel(r'$k \Delta P_{\ell}(k)$ [$(\mathrm{Mpc}/h)^{2}$]')
         ax.set_xlabel(r'$k$ [$h/\mathrm{Mpc}$]')
-        plt.show()
+        _show()
         exit()
 
     theory = FOLPSTracerCorrelationFunctionMultipoles()
     theory()
-    theory.plot(show=True)
+    theory.plot(show=_plot_tests())
 
 
 def test_folpsax():
@@ -1188,12 +1218,12 @@ def test_folpsax():
         ax.legend()
         ax.set_ylabel(r'$k \Delta P_{\ell}(k)$ [$(\mathrm{Mpc}/h)^{2}$]')
         ax.set_xlabel(r'$k$ [$h/\mathrm{Mpc}$]')
-        plt.show()
+        _show()
         exit()
 
     theory = FOLPSAXTracerCorrelationFunctionMultipoles()
     theory()
-    theory.plot(show=True)
+    theory.plot(show=_plot_tests())
 
 
 def test_params():
@@ -1223,7 +1253,7 @@ def test_png():
 
     theory = PNGTracerPowerSpectrumMultipoles(template=ShapeFitPowerSpectrumTemplate(z=1.), method='prim')
     theory(qpar=1.1, fnl_loc=2.)
-    theory.plot(show=True)
+    theory.plot(show=_plot_tests())
 
     from desilike.emulators import Emulator, TaylorEmulatorEngine
     emulator = Emulator(theory, engine=TaylorEmulatorEngine(order=1))
@@ -1238,6 +1268,7 @@ from desilike import utils
 from desilike.jax import numpy as jnp
 from desilike.theories.galaxy_clustering import DirectPowerSpectrumTemplate, APEffect
 from desilike.theories.galaxy_clustering import KaiserTracerPowerSpectrumMultipoles
+from desilike.theories.galaxy_clustering.base import _legendre_matrix
 from desilike.theories.galaxy_clustering.full_shape import BaseTheoryCorrelationFunctionFromPowerSpectrumMultipoles
 
 
@@ -1258,17 +1289,13 @@ class CorrelationFunctionMultipoles(BaseTheoryCorrelationFunctionFromPowerSpectr
         power.template.apeffect = APEffect(mode='qparqper')
         power.template.apeffect()
         self.mu, wmu = utils.weights_mu(mu, method=method)
-        self.legendre = [special.legendre(ell) for ell in self.ells]
-        self.wmu = np.array([wmu * (2 * ell + 1) * leg(self.mu) for ell, leg in zip(self.ells, self.legendre)])
+        self.wmu = (2 * np.array(self.ells)[:, None] + 1) * _legendre_matrix(self.mu, self.ells) * wmu
 
     def calculate(self):
-        power = []
-        for pk in self.power.power:
-            slope_high = (pk[-1] - pk[-2]) / np.log10(self.kin[-1] / self.kin[-2])
-            power.append(jnp.concatenate([jnp.interp(np.log10(self.k_mid), np.log10(self.kin), pk), (pk[-1] + slope_high * self.k_high) * self.pad_high], axis=-1))
-        s, corr = self.fftlog(np.vstack(power))
+        s, corr = self.fftlog(jnp.dot(jnp.asarray(self.power.power), self._pk_matrix))
         sap, muap = self.apeffect.ap_s_mu(self.s, self.mu)[1:]
-        self.corr = jnp.array([jnp.sum(jnp.interp(sap, ss, cc) * leg(muap) * wmu, axis=-1) for ss, cc, leg, wmu in zip(s, corr, self.legendre, self.wmu)])
+        xi = jnp.array([jnp.interp(sap, ss, cc) for ss, cc in zip(s, corr)])
+        self.corr = jnp.einsum('lsm,lm->ls', xi, _legendre_matrix(muap, self.ells) * self.wmu)
 
     @property
     def pt(self):
@@ -1292,24 +1319,28 @@ def test_pk_to_xi():
 
     k = np.logspace(-4., 3., 2048)
     ells = (0, 2, 4)
+    # loop-invariant: same k grid and ells for all theories
+    fftlog = PowerToCorrelation(k, ell=ells, q=0, lowring=True)
+    kin = np.geomspace(k[0], 1., 300)
+    # grid-dependent quantities are the same for all multipoles and theories: compute them once
+    mask = k > kin[-1]
+    log_kin, log_k_mid = np.log10(kin), np.log10(k[~mask])
+    k_high = np.log10(k[mask] / kin[-1])
+    pad_high = np.exp(-(k[mask] / kin[-1] - 1.)**2 / (2. * (10.)**2))
+    inv_dlogk = 1. / np.log10(kin[-1] / kin[-2])
+
+    def interp(pk):
+        slope_high = (pk[-1] - pk[-2]) * inv_dlogk
+        return np.concatenate([np.interp(log_k_mid, log_kin, pk), (pk[-1] + slope_high * k_high) * pad_high], axis=-1)
 
     for Theory in [KaiserTracerPowerSpectrumMultipoles, LPTVelocileptorsTracerPowerSpectrumMultipoles, REPTVelocileptorsTracerPowerSpectrumMultipoles]:
-        fftlog = PowerToCorrelation(k, ell=ells, q=0, lowring=True)
         theory = Theory(template=ShapeFitPowerSpectrumTemplate(z=1.1))
-        theory.init.update(k=np.geomspace(k[0], 1., 300), ells=ells)
-
-        def interp(k, kin, pk):
-            mask = k > kin[-1]
-            k_high = np.log10(k[mask] / kin[-1])
-            pad_high = np.exp(-(k[mask] / kin[-1] - 1.)**2 / (2. * (10.)**2))
-            slope_high = (pk[-1] - pk[-2]) / np.log10(kin[-1] / kin[-2])
-            k_mid = k[~mask]
-            return np.concatenate([np.interp(np.log10(k_mid), np.log10(kin), pk), (pk[-1] + slope_high * k_high) * pad_high], axis=-1)
+        theory.init.update(k=kin, ells=ells)
 
         fig, lax = plt.subplots(1, 2, sharex=False, sharey=False, figsize=(10, 6), squeeze=True)
         fig.subplots_adjust(hspace=0)
         pk = theory()
-        pk = [interp(k, theory.k, pk) for pk in pk]
+        pk = [interp(pk) for pk in pk]
         s, xi = fftlog(pk)
         for ill, ell in enumerate(theory.ells):
             lax[0].plot(k, pk[ill], color='C{:d}'.format(ill), label=r'$\ell = {:d}$'.format(ell))
@@ -1322,7 +1353,7 @@ def test_pk_to_xi():
         lax[0].set_xscale('log')
         #lax[0].set_xscale('linear')
         lax[1].set_xscale('linear')
-        plt.show()
+        _show()
     """
     theory = CorrelationFunctionMultipoles(s=np.linspace(1., 200., 1000), template=ShapeFitPowerSpectrumTemplate(z=1.1))
     ax = plt.gca()
@@ -1331,7 +1362,7 @@ def test_pk_to_xi():
         xi = theory(qpar=qpar)
         for ill, ell in enumerate(theory.ells):
             ax.plot(theory.s, theory.s**2 * (xi[ill] - xi_ref[ill]), color='C{:d}'.format(ill), label=r'$\ell = {:d}$'.format(ell))
-    plt.show()
+    _show()
 
     theory = CorrelationFunctionMultipoles(template=ShapeFitPowerSpectrumTemplate(z=1.1))
     #print(theory.all_params)
@@ -1353,7 +1384,7 @@ def test_pk_to_xi():
         xi = calculator(**params)
         for ill, ell in enumerate(calculator.ells):
             ax.plot(calculator.s, calculator.s**2 * xi[ill], color='C{:d}'.format(ill), linestyle='--')
-    plt.show()
+    _show()
     """
 
 
@@ -1378,7 +1409,7 @@ def test_ap_diff():
             pk = theory(qpar=qpar)
             for ill, ell in enumerate(theory.ells):
                 lax[1].plot(theory.k, theory.k * (pk[ill] - pk_ref[ill]), color='C{:d}'.format(ill), label=r'$\ell = {:d}$'.format(ell))
-        plt.show()
+        _show()
 
     for Theory in [DampedBAOWigglesTracerCorrelationFunctionMultipoles, ResummedBAOWigglesTracerCorrelationFunctionMultipoles]:
         theory = Theory(s=np.linspace(10., 200., 1000), template=BAOPowerSpectrumTemplate(z=1.1))
@@ -1392,14 +1423,14 @@ def test_ap_diff():
             xi = theory(qpar=qpar)
             for ill, ell in enumerate(theory.ells):
                 lax[1].plot(theory.s, theory.s**2 * (xi[ill] - xi_ref[ill]), color='C{:d}'.format(ill), label=r'$\ell = {:d}$'.format(ell))
-        plt.show()
+        _show()
 
     # For pybird, chat with Pierre Zhang
     for Theory in [KaiserTracerCorrelationFunctionMultipoles, LPTVelocileptorsTracerCorrelationFunctionMultipoles, REPTVelocileptorsTracerCorrelationFunctionMultipoles, PyBirdTracerCorrelationFunctionMultipoles]:
         theory = Theory(s=np.linspace(10., 200., 1000), template=ShapeFitPowerSpectrumTemplate(z=1.1))
         xi_ref = theory()
         if hasattr(theory, 'plot'):
-            theory.plot(show=True)
+            theory.plot(show=_plot_tests())
         fig, lax = plt.subplots(2, sharex=True, sharey=False, figsize=(10, 6), squeeze=True)
         fig.subplots_adjust(hspace=0)
         ax = plt.gca()
@@ -1409,7 +1440,7 @@ def test_ap_diff():
             xi = theory(qpar=qpar)
             for ill, ell in enumerate(theory.ells):
                 lax[1].plot(theory.s, theory.s**2 * (xi[ill] - xi_ref[ill]), color='C{:d}'.format(ill), label=r'$\ell = {:d}$'.format(ell))
-        plt.show()
+        _show()
 
     theory = KaiserTracerPowerSpectrumMultipoles(template=ShapeFitPowerSpectrumTemplate(z=1.1))
     theory.all_params['b1'].update(fixed=True)
@@ -1430,7 +1461,7 @@ def test_ap_diff():
         pk = calculator(**params)
         for ill, ell in enumerate(calculator.ells):
             ax.plot(calculator.k, calculator.k * pk[ill], color='C{:d}'.format(ill), linestyle='--')
-    plt.show()
+    _show()
 
     theory = KaiserTracerCorrelationFunctionMultipoles(template=ShapeFitPowerSpectrumTemplate(z=1.1))
     #theory.all_params['b1'].update(fixed=True)
@@ -1451,14 +1482,14 @@ def test_ap_diff():
         xi = calculator(**params)
         for ill, ell in enumerate(calculator.ells):
             ax.plot(calculator.s, calculator.s**2 * xi[ill], color='C{:d}'.format(ill), linestyle='--')
-    plt.show()
+    _show()
 
 
 def test_ptt():
 
     from desilike.theories.galaxy_clustering import BandVelocityPowerSpectrumTemplate, KaiserTracerPowerSpectrumMultipoles, BandVelocityPowerSpectrumCalculator
     z = 1.
-    theory = KaiserTracerPowerSpectrumMultipoles(template=BandVelocityPowerSpectrumTemplate(kp=np.linspace(0.01, 0.1, 10), z=z))
+    theory = KaiserTracerPowerSpectrumMultipoles(template=BandVelocityPowerSpectrumTemplate(kp=_kp_default, z=z))
     power = BandVelocityPowerSpectrumCalculator(calculator=theory)
     print(power().shape, power.varied_params)
 
@@ -1536,7 +1567,7 @@ def test_emulator_direct():
                 ax.plot(template.k, template.k * emulated_template.pk_dd, color=color, linestyle='--')
             template(**{param.name: center})
             emulated_template(**{param.name: center})
-            plt.show()
+            _show()
 
     Theories = {'kaiser': KaiserTracerPowerSpectrumMultipoles,
                 'velocileptors': LPTVelocileptorsTracerPowerSpectrumMultipoles,
@@ -1577,7 +1608,7 @@ def test_emulator_direct():
                             ax.plot(theory.k, theory.k * emulated_theory.power[ill], color=color, linestyle='--')
                     theory(**{param.name: center})
                     emulated_theory(**{param.name: center})
-                    plt.show()
+                    _show()
 
             plot()
 
@@ -1636,7 +1667,7 @@ def test_emulator_shapefit():
                         ax.plot(theory.k, theory.k * emulated_theory.power[ill], color=color, linestyle='--')
                 theory(**{param.name: center})
                 emulated_theory(**{param.name: center})
-                plt.show()
+                _show()
 
 
 def test_emulator_wigglesplit():
@@ -1654,7 +1685,7 @@ def test_emulator_wigglesplit():
     #ax = plt.gca()
     #ax.plot(template_direct.k, template_direct.k * template_direct.pk_dd)
     #ax.plot(template_direct.k, template_direct.k * template_direct_wigglesplit.pk_dd)
-    #plt.show()
+    #_show()
 
     size = 5
     #param_values = {'qiso': np.linspace(0.95, 1.05, size)}  #np.linspace(0.9, 1.1, size)}
@@ -1700,7 +1731,7 @@ def test_emulator_wigglesplit():
                         ax.plot(theory.k, theory.k * emulated_theory.power[ill], color=color, linestyle='--')
                 theory(**{param.name: center})
                 emulated_theory(**{param.name: center})
-                plt.show()
+                _show()
 
 
 def plot_direct():
@@ -1771,7 +1802,7 @@ def plot_direct():
                 ax.grid(True)
                 ax.legend()
                 plt.savefig(fn)
-                plt.show()
+                _show()
 
 
 def test_autodiff():
@@ -1792,7 +1823,7 @@ def test_autodiff():
                    FOLPSAXTracerCorrelationFunctionMultipoles(template=ShapeFitPowerSpectrumTemplate())]:
         params = {param.name: param.value for param in theory.all_params}
         theory(params)
-        theory.plot(show=True)
+        theory.plot(show=_plot_tests())
         t0 = time.time()
         niterations = 2
         for i in range(niterations):
@@ -1810,7 +1841,7 @@ def test_bao_phaseshift():
     theory()
     fig = theory.plot()
     theory(baoshift=3.)
-    theory.plot(fig=fig, show=True)
+    theory.plot(fig=fig, show=_plot_tests())
 
 
 def comparison_folps_velocileptors():
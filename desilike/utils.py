@@ -622,9 +622,15 @@ def weights_trapz(x):
     return jnp.insert(x[2:] - x[:-2], jnp.array([0, len(x) - 1]), jnp.array([x[1] - x[0], x[-1] - x[-2]])) / 2.
 
 
+@functools.lru_cache(maxsize=64)
+def _leggauss(nx):
+    # the Golub-Welsch eigensolve is O(nx^2); cache it, as theories are often re-instantiated with the same order
+    return np.polynomial.legendre.leggauss(nx)
+
+
 def weights_leggauss(nx, sym=False):
     """Return weights for Gauss-Legendre integration."""
-    x, wx = np.polynomial.legendre.leggauss((1 + sym) * nx)
+    x, wx = (array.copy() for array in _leggauss((1 + sym) * nx))  # copies, so callers can safely write into them
     if sym:
         x, wx = x[nx:], (wx[nx:] + wx[nx - 1::-1]) / 2.
     return x, wx